@@ -0,0 +1,41 @@
+"""Tests for the policy engine."""
+
+import unittest
+
+import numpy as np
+
+from vtown.model import TownDevelopmentModel
+from vtown.policy import PolicyHistory
+from vtown.spatial import INFRASTRUCTURE_TYPES
+
+
+class PolicyHistoryTest(unittest.TestCase):
+
+    def test_columns_grow_past_initial_capacity(self):
+        history = PolicyHistory()
+        for year in range(40):
+            history.append({'step': year, 'late': 1.0} if year >= 3 else {'step': year})
+
+        self.assertEqual(len(history), 40)
+        self.assertEqual(history.columns, ('step', 'late'))
+        np.testing.assert_array_equal(history['step'], np.arange(40))
+        self.assertTrue(np.isnan(history['late'][:3]).all())
+        self.assertTrue((history['late'][3:] == 1.0).all())
+
+    def test_history_records_infrastructure_built_per_type(self):
+        model = TownDevelopmentModel(random_seed=2)
+        model.run_steps(20)
+        history = model.policy_engine.policy_history
+
+        np.testing.assert_array_equal(history['step'], [5, 10, 15, 20])
+        built = sum(history[f'infrastructure_built_{name}'] for name in INFRASTRUCTURE_TYPES)
+        np.testing.assert_array_equal(built, history['infrastructure_projects_completed'])
+        # Each year's assessment counts the infrastructure built in earlier years
+        for name in INFRASTRUCTURE_TYPES:
+            coverage = history[f'situation_infrastructure_coverage_{name}']
+            np.testing.assert_array_equal(np.diff(coverage),
+                                          history[f'infrastructure_built_{name}'][:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for the array-backed agent populations."""
+
+import unittest
+
+import numpy as np
+
+from vtown.model import TownDevelopmentModel
+from vtown.population import FLAGS, FLAG_FLOOD, FLAG_LANDLESS
+
+
+class HouseholdFlagsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = TownDevelopmentModel(random_seed=4)
+        self.households = self.model.households
+
+    def test_flag_masks_unpack_packed_bits(self):
+        rng = np.random.default_rng(0)
+        bits = rng.random((len(FLAGS), self.households.size)) < 0.5
+        self.households.flags[:] = sum(np.where(bit, flag, 0) for flag, bit in zip(FLAGS, bits))
+
+        masks = self.households.flag_masks()
+        self.assertEqual(list(masks), list(FLAGS))
+        for flag, bit in zip(FLAGS, bits):
+            np.testing.assert_array_equal(masks[flag], bit)
+            np.testing.assert_array_equal(self.households.has_flag(flag), bit)
+
+    def test_agent_flags_set_and_clear_single_bits(self):
+        agent = self.households.agents[7]
+        self.households.flags[agent.index] = 0
+
+        agent.flood_affected = True
+        agent.is_landless = True
+        self.assertEqual(self.households.flags[agent.index], FLAG_FLOOD | FLAG_LANDLESS)
+        self.assertTrue(agent.flood_affected)
+        self.assertFalse(agent.has_microfinance_access)
+
+        agent.flood_affected = False
+        self.assertEqual(self.households.flags[agent.index], FLAG_LANDLESS)
+        self.assertTrue(agent.is_landless)
+        self.assertFalse(agent.flood_affected)
+
+
+class OccupancyTest(unittest.TestCase):
+
+    def test_occupancy_matches_grid_after_migration(self):
+        model = TownDevelopmentModel(random_seed=1)
+        households = model.households
+        start_x, start_y = households.pos_x.copy(), households.pos_y.copy()
+        model.run_steps(30)
+
+        # Some households moved, so occupancy was updated incrementally
+        moved = (households.pos_x != start_x) | (households.pos_y != start_y)
+        self.assertTrue(moved.any())
+
+        # The incrementally maintained grid agrees with a recount and with Mesa
+        np.testing.assert_array_equal(model.occupancy, model.occupancy_grid())
+        mesa_counts = np.array([[len(model.grid.get_cell_list_contents([(x, y)]))
+                                 for y in range(model.grid.height)]
+                                for x in range(model.grid.width)])
+        np.testing.assert_array_equal(model.occupancy, mesa_counts)
+
+        # Agent positions, population arrays and grid cells agree
+        for agent in households.agents:
+            self.assertEqual(agent.pos, (households.pos_x[agent.index],
+                                         households.pos_y[agent.index]))
+            self.assertIn(agent, model.grid.get_cell_list_contents([agent.pos]))
+
+
+if __name__ == "__main__":
+    unittest.main()
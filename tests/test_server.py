@@ -0,0 +1,27 @@
+"""Tests for the visualization server's agent portrayals."""
+
+import json
+import unittest
+
+from vtown.agents import KIND_BUSINESS, KIND_HOUSEHOLD, KIND_INFRASTRUCTURE
+from vtown.model import TownDevelopmentModel
+from vtown.server import agent_portrayal
+
+
+class AgentPortrayalTest(unittest.TestCase):
+
+    def test_portrayals_are_json_serializable(self):
+        # The canvas grid sends portrayals to the browser as JSON
+        model = TownDevelopmentModel(random_seed=1)
+        model.run_steps(12)
+
+        kinds = set()
+        for population in (model.households, model.businesses, model.infrastructure):
+            for agent in population.agents:
+                json.dumps(agent_portrayal(agent))
+                kinds.add(agent.kind)
+        self.assertEqual(kinds, {KIND_HOUSEHOLD, KIND_BUSINESS, KIND_INFRASTRUCTURE})
+
+
+if __name__ == "__main__":
+    unittest.main()
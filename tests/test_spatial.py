@@ -0,0 +1,108 @@
+"""Tests for the summed-area-table spatial indexes."""
+
+import unittest
+
+import numpy as np
+from mesa import Agent, Model
+from mesa.space import MultiGrid
+
+from vtown.spatial import INFRASTRUCTURE_TYPES, HouseholdIndex, InfrastructureIndex, moore_offsets
+
+WIDTH, HEIGHT = 9, 7
+
+
+class _Marker(Agent):
+    """Agent placed on a Mesa grid to check index counts against."""
+
+    def __init__(self, unique_id, model, code, bonus=0.0):
+        super().__init__(unique_id, model)
+        self.code = code
+        self.bonus = bonus
+
+
+class GridIndexTest(unittest.TestCase):
+    """Window queries must agree with Mesa's neighbor lists, including at the edges."""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.model = Model()
+        self.grid = MultiGrid(WIDTH, HEIGHT, torus=False)
+
+        # Several agents per cell in places, and every corner occupied
+        n = 60
+        corners = np.array([(0, 0), (0, HEIGHT - 1), (WIDTH - 1, 0), (WIDTH - 1, HEIGHT - 1)])
+        self.pos_x = np.concatenate([corners[:, 0], rng.integers(0, WIDTH, n)])
+        self.pos_y = np.concatenate([corners[:, 1], rng.integers(0, HEIGHT, n)])
+        self.codes = rng.integers(0, len(INFRASTRUCTURE_TYPES), len(self.pos_x))
+        self.bonus = rng.uniform(0.1, 0.3, len(self.pos_x))
+        for i, (x, y) in enumerate(zip(self.pos_x, self.pos_y)):
+            self.grid.place_agent(_Marker(i, self.model, self.codes[i], self.bonus[i]),
+                                  (int(x), int(y)))
+
+    def neighbors(self, x, y, radius):
+        return self.grid.get_neighbors((x, y), moore=True, include_center=False, radius=radius)
+
+    def cells(self):
+        return [(x, y) for x in range(WIDTH) for y in range(HEIGHT)]
+
+    def test_infrastructure_counts_match_mesa(self):
+        index = InfrastructureIndex(WIDTH, HEIGHT)
+        index.rebuild(self.pos_x, self.pos_y, self.codes, self.bonus)
+
+        for radius in (1, 2, 4):
+            for x, y in self.cells():
+                neighbors = self.neighbors(x, y, radius)
+                for code, name in enumerate(INFRASTRUCTURE_TYPES):
+                    expected = sum(agent.code == code for agent in neighbors)
+                    self.assertEqual(index.count(name, x, y, radius), expected,
+                                     (name, x, y, radius))
+                    self.assertEqual(index.has_access(name, x, y, radius), expected > 0)
+                self.assertAlmostEqual(index.infrastructure_score(x, y, radius),
+                                       sum(agent.bonus for agent in neighbors), places=10)
+
+    def test_vectorized_queries_match_scalar_queries(self):
+        index = InfrastructureIndex(WIDTH, HEIGHT)
+        index.rebuild(self.pos_x, self.pos_y, self.codes, self.bonus)
+        xs, ys = np.array(self.cells()).T
+
+        counts = index.count(INFRASTRUCTURE_TYPES, xs, ys, 2)
+        self.assertEqual(counts.shape, (len(INFRASTRUCTURE_TYPES), len(xs)))
+        for row, name in enumerate(INFRASTRUCTURE_TYPES):
+            np.testing.assert_array_equal(
+                counts[row], [index.count(name, x, y, 2) for x, y in zip(xs, ys)])
+
+        score_grid = index.infrastructure_score_grid(3)
+        np.testing.assert_allclose(score_grid[xs, ys], index.infrastructure_score(xs, ys, 3))
+
+    def test_household_counts_match_mesa(self):
+        n_sectors = 3
+        sectors = self.codes % n_sectors
+        # Unplaced households (position -1) are left out of the index
+        index = HouseholdIndex(WIDTH, HEIGHT, n_sectors)
+        index.rebuild(np.append(self.pos_x, -1), np.append(self.pos_y, -1), np.append(sectors, 0))
+
+        xs, ys = np.array(self.cells()).T
+        for radius in (1, 3):
+            for x, y in self.cells():
+                neighbors = self.neighbors(x, y, radius)
+                self.assertEqual(index.count(x, y, radius), len(neighbors), (x, y, radius))
+                for sector in range(n_sectors):
+                    self.assertEqual(index.count(x, y, radius, sector),
+                                     sum(agent.code % n_sectors == sector for agent in neighbors))
+            query_sectors = (xs + ys) % n_sectors
+            np.testing.assert_array_equal(
+                index.count(xs, ys, radius, query_sectors),
+                [index.count(x, y, radius, s) for x, y, s in zip(xs, ys, query_sectors)])
+
+    def test_moore_offsets_follow_mesa_neighborhood_order(self):
+        center = (WIDTH // 2, HEIGHT // 2)
+        for radius in (1, 2):
+            expected = [(x - center[0], y - center[1]) for x, y in
+                        self.grid.get_neighborhood(center, moore=True, include_center=False,
+                                                   radius=radius)]
+            self.assertEqual([tuple(offset) for offset in moore_offsets(radius).tolist()],
+                             expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for the shared summary statistics."""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from vtown import stats
+from vtown.stats import gini
+
+
+def reference_gini(incomes):
+    """Mean absolute difference over all pairs of positive incomes, O(n^2)."""
+    incomes = np.asarray(incomes, dtype=np.float64)
+    incomes = incomes[incomes > 0]
+    n = len(incomes)
+    if n < 2:
+        return 0.0
+    return np.abs(incomes[:, None] - incomes[None, :]).sum() / (2 * n * n * incomes.mean())
+
+
+class GiniTest(unittest.TestCase):
+
+    def test_matches_pairwise_reference(self):
+        rng = np.random.default_rng(0)
+        for n in (2, 3, 10, 257):
+            incomes = rng.lognormal(8, 0.6, n)
+            self.assertAlmostEqual(gini(incomes), reference_gini(incomes), places=12)
+
+    def test_ignores_non_positive_incomes(self):
+        incomes = np.array([0.0, -50.0, 1000.0, 3000.0, 0.0, 6000.0])
+        self.assertAlmostEqual(gini(incomes), reference_gini(incomes), places=12)
+        self.assertAlmostEqual(gini(incomes), gini(incomes[incomes > 0]), places=12)
+
+    def test_degenerate_inputs(self):
+        self.assertEqual(gini(np.array([])), 0.0)
+        self.assertEqual(gini(np.array([2500.0])), 0.0)
+        self.assertEqual(gini(np.array([0.0, -1.0, 4000.0])), 0.0)
+        self.assertAlmostEqual(gini(np.full(50, 3000.0)), 0.0, places=12)
+
+    def test_does_not_modify_input(self):
+        incomes = np.array([5000.0, 1000.0, 3000.0, 2000.0])
+        gini(incomes)
+        np.testing.assert_array_equal(incomes, [5000.0, 1000.0, 3000.0, 2000.0])
+
+    def test_histogram_path_matches_reference(self):
+        # Whole-Taka incomes with repeats, so binning loses nothing
+        rng = np.random.default_rng(1)
+        incomes = rng.integers(1, 20000, 3000).astype(np.float64)
+        with mock.patch.object(stats, 'GINI_HISTOGRAM_MIN_SIZE', 100), \
+                mock.patch.object(stats, '_gini_histogram', wraps=stats._gini_histogram) as histogram:
+            result = gini(incomes)
+        histogram.assert_called_once()
+        self.assertAlmostEqual(result, reference_gini(incomes), places=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Tests for the analysis utilities."""
+
+import tempfile
+import unittest
+
+import numpy as np
+
+from vtown.run_headless import run_single_simulation
+from vtown.stats import gini
+from vtown.utils import load_and_analyze_results
+
+
+class RunAnalyzeRoundTripTest(unittest.TestCase):
+
+    def test_analysis_reads_final_step_of_saved_run(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            model = run_single_simulation(None, steps=6, output_dir=output_dir, seed=1,
+                                          verbose=False)
+            analysis = load_and_analyze_results(output_dir)
+
+        incomes = model.households.income.astype(np.float64)
+        distribution = analysis['final_income_distribution']
+        self.assertIn('development_trajectory', analysis)
+        self.assertAlmostEqual(distribution['mean'], incomes.mean(), places=2)
+        self.assertAlmostEqual(distribution['gini'], gini(incomes), places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,7 @@ An agent-based model simulating the transformation of a Bangladeshi village
 into a town through infrastructure development and policy interventions.
 """
 
-from .agents import HouseholdAgent, BusinessAgent, InfrastructureAgent
-from .model import TownDevelopmentModel
-from .policy import PolicyEngine
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Village to Town Development Team"
@@ -17,5 +15,31 @@ __all__ = [
     "BusinessAgent", 
     "InfrastructureAgent",
     "TownDevelopmentModel",
+    "HouseholdPopulation",
+    "BusinessPopulation",
+    "InfrastructurePopulation",
+    "SimulationParams",
     "PolicyEngine",
 ]
+
+# Public classes are imported from their modules on first access, so running
+# a submodule such as the headless CLI does not load Mesa and pandas up front
+_EXPORTS = {
+    "HouseholdAgent": "agents",
+    "BusinessAgent": "agents",
+    "InfrastructureAgent": "agents",
+    "TownDevelopmentModel": "model",
+    "HouseholdPopulation": "population",
+    "BusinessPopulation": "population",
+    "InfrastructurePopulation": "population",
+    "SimulationParams": "params",
+    "PolicyEngine": "policy",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -4,9 +4,10 @@ Main entry point for the vtown package.
 This allows running the package as a module using python -m vtown
 """
 
-import sys
 import argparse
 
+from .run_headless import OUTPUT_FORMATS, OUTPUT_LEVELS
+
 def main():
     """Main entry point with subcommands."""
     
@@ -29,6 +30,12 @@ def main():
     run_parser.add_argument('--output', type=str, default='outputs', help='Output directory')
     run_parser.add_argument('--seed', type=int, help='Random seed')
     run_parser.add_argument('--runs', type=int, default=1, help='Number of runs')
+    run_parser.add_argument('--processes', type=int, 
+                           help='Worker processes for multiple runs (default: CPU count)')
+    run_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv',
+                           help='Output file format (parquet requires pyarrow)')
+    run_parser.add_argument('--output-level', choices=OUTPUT_LEVELS, default='full',
+                           help='Outputs saved for multiple runs')
     
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze simulation results')
@@ -37,27 +44,27 @@ def main():
     args = parser.parse_args()
     
     if args.command == 'server':
-        from .server import server
-        server.port = args.port
+        from .server import make_server
+        server = make_server(args.port)
         print(f"Starting server on port {args.port}")
         server.launch()
         
     elif args.command == 'run':
-        from .run_headless import main as run_main
-        # Override sys.argv to pass arguments to run_main
-        sys.argv = ['run_headless.py']
-        if args.config:
-            sys.argv.extend(['--config', args.config])
-        if args.steps:
-            sys.argv.extend(['--steps', str(args.steps)])
-        if args.output:
-            sys.argv.extend(['--output', args.output])
-        if args.seed:
-            sys.argv.extend(['--seed', str(args.seed)])
-        if args.runs > 1:
-            sys.argv.extend(['--runs', str(args.runs), '--batch'])
-        
-        run_main()
+        from .run_headless import output_format_error, run
+        error = output_format_error(args.format)
+        if error is not None:
+            run_parser.error(error)
+        run(
+            config=args.config,
+            steps=args.steps,
+            output=args.output,
+            seed=args.seed,
+            runs=args.runs,
+            batch=args.runs > 1,
+            processes=args.processes,
+            output_format=args.format,
+            output_level=args.output_level
+        )
         
     elif args.command == 'analyze':
         from .utils import load_and_analyze_results
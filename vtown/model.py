@@ -2,28 +2,65 @@
 Main simulation model for the Village to Town development simulation.
 
 This module contains the TownDevelopmentModel class which coordinates
-all agents, manages the spatial environment, handles scheduling,
-and collects data for analysis.
+all agents, manages the spatial environment, steps the agent
+populations, and collects data for analysis.
 """
 
+import copy
+import os
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from mesa import Model
-from mesa.time import RandomActivation
 from mesa.space import MultiGrid
 from mesa.datacollection import DataCollector
-from typing import Dict, List, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import yaml
 
 from .agents import HouseholdAgent, BusinessAgent, InfrastructureAgent
+from .params import SimulationParams
+from .population import (
+    AGRICULTURE, BUSINESS_SIZES, SECTORS, SECTOR_CODES, BusinessPopulation, HouseholdPopulation, InfrastructurePopulation
+)
+from .spatial import INFRASTRUCTURE_TYPES, HouseholdIndex, InfrastructureIndex
+from .stats import gini
 from .policy import PolicyEngine
 
+# Model-level reporters, computed together once per step by compute_metrics
+METRICS = (
+    "GDP_Per_Capita", "Gini_Coefficient", "Average_Education", "Average_Health",
+    "Urbanization_Rate", "Infrastructure_Coverage", "Service_Access_Rate",
+    "Agricultural_Employment", "Manufacturing_Employment", "Services_Employment",
+)
+
+
+@lru_cache(maxsize=None)
+def _load_config(config_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file.
+    
+    Cached by path and modification time so repeated model construction
+    (batch runs, sweeps) parses each file once. Callers must copy the
+    result before modifying it.
+    """
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+# Columns of the agent-level data, in output order
+AGENT_DATA_COLUMNS = (
+    "Step", "AgentID", "Agent_Type", "Position_X", "Position_Y", "Income", "Education",
+    "Health", "Sector", "Savings", "Business_Type", "Business_Size", "Revenue", "Employees",
+    "Infrastructure_Type", "Quality", "Coverage_Radius",
+)
+
 
 class TownDevelopmentModel(Model):
     """
     Main model class for the Village to Town development simulation.
     
-    Manages the spatial grid, agent scheduling, policy interventions,
+    Manages the spatial grid, agent populations, policy interventions,
     and data collection for analyzing development outcomes.
     """
     
@@ -32,8 +69,8 @@ class TownDevelopmentModel(Model):
         
         # Load configuration
         if config_path:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            mtime = os.path.getmtime(config_path)
+            self.config = copy.deepcopy(_load_config(config_path, mtime))
         else:
             self.config = self._default_config()
             
@@ -42,27 +79,42 @@ class TownDevelopmentModel(Model):
             if key in self.config:
                 self.config[key] = value
                 
+        # Single random generator for all model draws
+        seed = self.config.get('random_seed')
+        self.rng = np.random.default_rng(seed)
+        self.reset_randomizer(seed)
+        
+        self.params = SimulationParams.from_config(self.config)
+        
         # Initialize model components
         self.setup_space()
-        self.setup_scheduling()
         self.setup_data_collection()
         self.setup_policy_engine()
         
+        # Infrastructure grows over the run; the other populations are
+        # sized when they are created
+        self.infrastructure = InfrastructurePopulation(self)
+        
         # Model state
         self.step_count = 0
         self.total_population = 0
         self.total_businesses = 0
-        self.infrastructure_coverage = {
-            'road': 0, 'school': 0, 'clinic': 0, 'market': 0, 'utility': 0
-        }
+        # Households served per infrastructure type, indexed by type code
+        self.infrastructure_coverage = np.zeros(len(INFRASTRUCTURE_TYPES), dtype=np.int64)
+        # Sum of infrastructure_coverage, maintained where coverage is recorded
+        self.total_coverage = 0
         
         # Initialize agents
         self.create_initial_population()
         self.create_initial_businesses()
         self.create_initial_infrastructure()
         
+        # Agents per cell, kept current as agents are placed and moved
+        self.occupancy = self.occupancy_grid()
+        
         # Start data collection
-        self.datacollector.collect(self)
+        self.update_statistics()
+        self.collect()
         
     def setup_space(self):
         """Initialize the spatial grid."""
@@ -71,10 +123,20 @@ class TownDevelopmentModel(Model):
             height=self.config['grid_height'],
             torus=False
         )
-        
-    def setup_scheduling(self):
-        """Initialize agent scheduling."""
-        self.schedule = RandomActivation(self)
+        self.infrastructure_index = InfrastructureIndex(self.grid.width, self.grid.height)
+        self.household_index = HouseholdIndex(self.grid.width, self.grid.height, len(SECTORS))
+        
+        # Distance from every cell to the town center, indexed [x, y]
+        xs, ys = np.meshgrid(np.arange(self.grid.width), np.arange(self.grid.height), indexing='ij')
+        self.dist_to_center = np.hypot(xs - self.grid.width // 2,
+                                       ys - self.grid.height // 2).astype(np.float32)
+        self.is_urban = self.dist_to_center <= 10
+        # Urban proximity bonus used in the income potential
+        self.urban_bonus = np.maximum(0, 1 - self.dist_to_center / 20)
+        # Static part of the income potential; only the infrastructure term
+        # is recomputed when the index is rebuilt
+        self.base_income_potential = 1000 + self.urban_bonus * 2000
+        self.income_potential_grid = np.zeros((self.grid.width, self.grid.height), dtype=np.float32)
         
     def setup_data_collection(self):
         """Initialize data collection system."""
@@ -82,45 +144,19 @@ class TownDevelopmentModel(Model):
             "Step": lambda m: m.step_count,
             "Population": lambda m: m.total_population,
             "Total_Businesses": lambda m: m.total_businesses,
-            "GDP_Per_Capita": self.calculate_gdp_per_capita,
-            "Gini_Coefficient": self.calculate_gini_coefficient,
-            "Average_Education": self.calculate_average_education,
-            "Average_Health": self.calculate_average_health,
-            "Urbanization_Rate": self.calculate_urbanization_rate,
-            "Infrastructure_Coverage": self.calculate_infrastructure_coverage,
-            "Service_Access_Rate": self.calculate_service_access_rate,
-            "Agricultural_Employment": lambda m: m.count_by_sector('agriculture'),
-            "Manufacturing_Employment": lambda m: m.count_by_sector('manufacturing'),
-            "Services_Employment": lambda m: m.count_by_sector('services'),
-            "Road_Coverage": lambda m: m.infrastructure_coverage['road'],
-            "School_Coverage": lambda m: m.infrastructure_coverage['school'],
-            "Clinic_Coverage": lambda m: m.infrastructure_coverage['clinic'],
-            "Market_Coverage": lambda m: m.infrastructure_coverage['market'],
-            "Utility_Coverage": lambda m: m.infrastructure_coverage['utility'],
+            **{name: (lambda m, name=name: m.metrics[name]) for name in METRICS},
+            **{f"{name.capitalize()}_Coverage": (lambda m, code=code: int(m.infrastructure_coverage[code]))
+               for code, name in enumerate(INFRASTRUCTURE_TYPES)},
         }
         
-        agent_reporters = {
-            "Agent_Type": lambda a: type(a).__name__,
-            "Position_X": lambda a: a.pos[0] if hasattr(a, 'pos') else None,
-            "Position_Y": lambda a: a.pos[1] if hasattr(a, 'pos') else None,
-            "Income": lambda a: getattr(a, 'income', None),
-            "Education": lambda a: getattr(a, 'education_level', None),
-            "Health": lambda a: getattr(a, 'health_index', None),
-            "Sector": lambda a: getattr(a, 'sector', None),
-            "Savings": lambda a: getattr(a, 'savings', None),
-            "Business_Type": lambda a: getattr(a, 'business_type', None),
-            "Business_Size": lambda a: getattr(a, 'size', None),
-            "Revenue": lambda a: getattr(a, 'revenue', None),
-            "Employees": lambda a: getattr(a, 'current_employees', None),
-            "Infrastructure_Type": lambda a: getattr(a, 'infrastructure_type', None),
-            "Quality": lambda a: getattr(a, 'quality', None),
-            "Coverage_Radius": lambda a: getattr(a, 'coverage_radius', None),
-        }
+        self.datacollector = DataCollector(model_reporters=model_reporters)
         
-        self.datacollector = DataCollector(
-            model_reporters=model_reporters,
-            agent_reporters=agent_reporters
-        )
+        # Agent-level data is snapshotted from the population columns rather
+        # than through per-agent reporters
+        self.collect_agent_data = self.config.get('collect_agent_data', True)
+        self.agent_data_interval = max(1, self.config.get('output_frequency', 1))
+        self._agent_snapshots: List[pd.DataFrame] = []
+        self._agent_data_path = None
         
     def setup_policy_engine(self):
         """Initialize the policy intervention system."""
@@ -133,99 +169,126 @@ class TownDevelopmentModel(Model):
     def create_initial_population(self):
         """Create initial household population."""
         n_households = self.config['initial_population']
+        self.households = HouseholdPopulation(self, n_households)
+        self.households.initialize()
+        
+        # Place households with some clustering: 70% in rural areas, 30% in
+        # the initial town center
+        rural = np.arange(n_households) < n_households * 0.7
+        n_rural = int(rural.sum())
+        n_town = n_households - n_rural
+        center_x = self.grid.width // 2
+        center_y = self.grid.height // 2
+        xs = np.concatenate([self.rng.integers(0, self.grid.width // 3, n_rural),
+                             self.rng.integers(center_x - 5, center_x + 5, n_town)])
+        ys = np.concatenate([self.rng.integers(0, self.grid.height // 3, n_rural),
+                             self.rng.integers(center_y - 5, center_y + 5, n_town)])
+        xs = np.clip(xs, 0, self.grid.width - 1)
+        ys = np.clip(ys, 0, self.grid.height - 1)
         
         for i in range(n_households):
-            # Place households with some clustering
-            if i < n_households * 0.7:  # 70% in rural areas
-                x = np.random.randint(0, self.grid.width // 3)
-                y = np.random.randint(0, self.grid.height // 3)
-            else:  # 30% in initial town center
-                center_x = self.grid.width // 2
-                center_y = self.grid.height // 2
-                x = np.random.randint(center_x - 5, center_x + 5)
-                y = np.random.randint(center_y - 5, center_y + 5)
-                
-            x = max(0, min(x, self.grid.width - 1))
-            y = max(0, min(y, self.grid.height - 1))
-            
-            household = HouseholdAgent(i, self, (x, y))
-            self.grid.place_agent(household, (x, y))
-            self.schedule.add(household)
+            pos = (int(xs[i]), int(ys[i]))
+            household = HouseholdAgent(i, self, pos)
+            self.grid.place_agent(household, pos)
             
         self.total_population = n_households
         
     def create_initial_businesses(self):
         """Create initial business population."""
         n_businesses = self.config['initial_businesses']
+        self.businesses = BusinessPopulation(self, n_businesses)
+        self.businesses.initialize()
+        
+        # Location based on business type: agriculture in the rural quadrant,
+        # other sectors around the town center
+        agricultural = self.businesses.business_type == AGRICULTURE
+        center_x = self.grid.width // 2
+        center_y = self.grid.height // 2
+        xs = np.where(agricultural,
+                      self.rng.integers(0, self.grid.width // 2, n_businesses),
+                      self.rng.integers(center_x - 10, center_x + 10, n_businesses))
+        ys = np.where(agricultural,
+                      self.rng.integers(0, self.grid.height // 2, n_businesses),
+                      self.rng.integers(center_y - 10, center_y + 10, n_businesses))
+        xs = np.clip(xs, 0, self.grid.width - 1)
+        ys = np.clip(ys, 0, self.grid.height - 1)
         
         for i in range(n_businesses):
-            # Business type distribution
-            business_type = np.random.choice(
-                ['agriculture', 'manufacturing', 'services'],
-                p=[0.5, 0.3, 0.2]
-            )
-            
-            # Location based on business type
-            if business_type == 'agriculture':
-                x = np.random.randint(0, self.grid.width // 2)
-                y = np.random.randint(0, self.grid.height // 2)
-            else:
-                center_x = self.grid.width // 2
-                center_y = self.grid.height // 2
-                x = np.random.randint(center_x - 10, center_x + 10)
-                y = np.random.randint(center_y - 10, center_y + 10)
-                
-            x = max(0, min(x, self.grid.width - 1))
-            y = max(0, min(y, self.grid.height - 1))
-            
-            business = BusinessAgent(
-                self.total_population + i, self, (x, y), business_type
-            )
-            self.grid.place_agent(business, (x, y))
-            self.schedule.add(business)
+            pos = (int(xs[i]), int(ys[i]))
+            business = BusinessAgent(self.total_population + i, self, pos)
+            self.grid.place_agent(business, pos)
             
         self.total_businesses = n_businesses
         
     def create_initial_infrastructure(self):
         """Create initial infrastructure."""
-        infrastructure_types = ['road', 'school', 'clinic', 'market', 'utility']
-        
-        # Start with basic infrastructure in town center
+        # Start with one of each infrastructure type near the town center,
+        # then add some initial roads connecting areas
+        n_roads = 5
+        infrastructure_types = list(INFRASTRUCTURE_TYPES) + ['road'] * n_roads
         center_x = self.grid.width // 2
         center_y = self.grid.height // 2
+        n_center = len(INFRASTRUCTURE_TYPES)
+        xs = np.concatenate([center_x + self.rng.integers(-3, 4, n_center),
+                             self.rng.integers(0, self.grid.width, n_roads)])
+        ys = np.concatenate([center_y + self.rng.integers(-3, 4, n_center),
+                             self.rng.integers(0, self.grid.height, n_roads)])
+        xs = np.clip(xs, 0, self.grid.width - 1)
+        ys = np.clip(ys, 0, self.grid.height - 1)
         
         agent_id = self.total_population + self.total_businesses
         
-        # Place one of each infrastructure type near center
         for i, infra_type in enumerate(infrastructure_types):
-            x = center_x + np.random.randint(-3, 4)
-            y = center_y + np.random.randint(-3, 4)
-            x = max(0, min(x, self.grid.width - 1))
-            y = max(0, min(y, self.grid.height - 1))
-            
-            infrastructure = InfrastructureAgent(
-                agent_id + i, self, (x, y), infra_type
-            )
-            self.grid.place_agent(infrastructure, (x, y))
-            self.schedule.add(infrastructure)
+            pos = (int(xs[i]), int(ys[i]))
+            infrastructure = InfrastructureAgent(agent_id + i, self, pos, infra_type)
+            self.grid.place_agent(infrastructure, pos)
             
-        # Add some initial roads connecting areas
-        for i in range(5):
-            x = np.random.randint(0, self.grid.width)
-            y = np.random.randint(0, self.grid.height)
-            
-            road = InfrastructureAgent(
-                agent_id + len(infrastructure_types) + i, self, (x, y), 'road'
-            )
-            self.grid.place_agent(road, (x, y))
-            self.schedule.add(road)
+        # Unique ids are assigned sequentially; agents added later continue here
+        self.next_agent_id = agent_id + len(infrastructure_types)
+        
+        self.rebuild_infrastructure_index()
+        
+    def rebuild_infrastructure_index(self):
+        """Rebuild the infrastructure spatial index and the income potential field."""
+        infrastructure = self.infrastructure
+        self.infrastructure_version = infrastructure.version
+        self.infrastructure_index.rebuild(
+            infrastructure.pos_x, infrastructure.pos_y, infrastructure.infrastructure_type,
+            infrastructure.productivity_bonus()
+        )
+        
+        # Potential income of every cell, from urban proximity and nearby infrastructure
+        infrastructure_score = self.infrastructure_index.infrastructure_score_grid(3)
+        self.income_potential_grid[:] = self.base_income_potential + infrastructure_score * 500
+        
+    def occupancy_grid(self) -> np.ndarray:
+        """Count the agents of every kind in each grid cell."""
+        occupancy = np.zeros((self.grid.width, self.grid.height), dtype=np.int64)
+        for population in (self.households, self.businesses, self.infrastructure):
+            placed = population.pos_x >= 0
+            np.add.at(occupancy, (population.pos_x[placed], population.pos_y[placed]), 1)
+        return occupancy
+        
+    def rebuild_household_index(self):
+        """Rebuild the spatial index used for household neighborhood queries."""
+        households = self.households
+        self.household_index.rebuild(households.pos_x, households.pos_y, households.sector)
             
     def step(self):
         """Execute one step of the simulation."""
         self.step_count += 1
         
-        # Agent actions
-        self.schedule.step()
+        # Rebuild only if infrastructure was added, degraded or upgraded
+        if self.infrastructure.version != self.infrastructure_version:
+            self.rebuild_infrastructure_index()
+        
+        self._advance_time()
+        
+        # Agent actions, one population at a time
+        self.households.step()
+        self.rebuild_household_index()
+        self.businesses.step()
+        self.infrastructure.step()
         
         # Policy interventions (every 5 steps = annually)
         if self.step_count % 5 == 0:
@@ -235,27 +298,58 @@ class TownDevelopmentModel(Model):
         self.update_statistics()
         
         # Collect data
-        self.datacollector.collect(self)
-        
+        self.collect()
+        
+    def run_steps(self, steps: int, on_progress: Optional[Callable[[int], None]] = None,
+                  progress_every: int = 20):
+        """
+        Advance the simulation by a number of steps.
+        
+        ``on_progress`` is called with the number of steps completed every
+        ``progress_every`` steps.
+        """
+        for completed in range(1, steps + 1):
+            self.step()
+            if on_progress is not None and completed % progress_every == 0:
+                on_progress(completed)
+                
     def update_statistics(self):
         """Update model-level statistics."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
-        businesses = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, BusinessAgent)]
+        self.total_population = self.households.size
+        self.total_businesses = self.businesses.size
+        self.metrics = self.compute_metrics()
         
-        self.total_population = len(households)
-        self.total_businesses = len(businesses)
+    def compute_metrics(self) -> Dict[str, float]:
+        """
+        Compute all model-level reporters together.
+        
+        Intermediates shared between reporters, such as the float64 income
+        column and the sector counts, are computed once; the data collector
+        reads the resulting dictionary.
+        """
+        households = self.households
+        incomes = households.income.astype(np.float64)
+        sector_counts = np.bincount(households.sector, minlength=len(SECTORS))
+        
+        total_gdp = incomes.sum() * 12 + self.businesses.revenue.sum(dtype=np.float64) * 12
+        
+        return {
+            "GDP_Per_Capita": total_gdp / self.total_population if self.total_population > 0 else 0,
+            "Gini_Coefficient": gini(incomes),
+            "Average_Education": self.calculate_average_education(),
+            "Average_Health": self.calculate_average_health(),
+            "Urbanization_Rate": self.calculate_urbanization_rate(),
+            "Infrastructure_Coverage": self.calculate_infrastructure_coverage(),
+            "Service_Access_Rate": self.calculate_service_access_rate(),
+            "Agricultural_Employment": int(sector_counts[SECTOR_CODES['agriculture']]),
+            "Manufacturing_Employment": int(sector_counts[SECTOR_CODES['manufacturing']]),
+            "Services_Employment": int(sector_counts[SECTOR_CODES['services']]),
+        }
         
     def calculate_gdp_per_capita(self) -> float:
         """Calculate GDP per capita."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
-        businesses = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, BusinessAgent)]
-        
-        total_income = sum(h.income for h in households) * 12  # Annual income
-        total_business_revenue = sum(b.revenue for b in businesses) * 12
+        total_income = self.households.income.sum(dtype=np.float64) * 12  # Annual income
+        total_business_revenue = self.businesses.revenue.sum(dtype=np.float64) * 12
         
         total_gdp = total_income + total_business_revenue
         
@@ -263,126 +357,170 @@ class TownDevelopmentModel(Model):
         
     def calculate_gini_coefficient(self) -> float:
         """Calculate Gini coefficient for income inequality."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
-        
-        if len(households) < 2:
+        if self.households.size < 2:
             return 0
             
-        incomes = np.array([h.income for h in households])
-        incomes = incomes[incomes > 0]
-        if len(incomes) < 2:
-            return 0
-        incomes.sort()
-        n = len(incomes)
-        index = np.arange(1, n + 1)
-        gini = (np.sum((2 * index - n - 1) * incomes)) / (n * np.sum(incomes))
-        return float(gini)
+        return gini(self.households.income.astype(np.float64))
         
     def calculate_average_education(self) -> float:
         """Calculate average education level."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
+        households = self.households
         
-        if not households:
+        if households.size == 0:
             return 0
             
-        return sum(h.education_level for h in households) / len(households)
+        return int(households.education_level.sum()) / households.size
         
     def calculate_average_health(self) -> float:
         """Calculate average health index."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
+        households = self.households
         
-        if not households:
+        if households.size == 0:
             return 0
             
-        return sum(h.health_index for h in households) / len(households)
+        return float(households.health_index.mean(dtype=np.float64))
         
     def calculate_urbanization_rate(self) -> float:
         """Calculate percentage of population in urban areas."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
-        
-        if not households:
+        households = self.households
+        if households.size == 0:
             return 0
             
-        center_x = self.grid.width // 2
-        center_y = self.grid.height // 2
-        urban_radius = 10
-        
-        urban_households = 0
-        for h in households:
-            distance = np.sqrt((h.pos[0] - center_x)**2 + (h.pos[1] - center_y)**2)
-            if distance <= urban_radius:
-                urban_households += 1
-                
-        return urban_households / len(households)
+        return float(self.is_urban[households.pos_x, households.pos_y].mean())
         
     def calculate_infrastructure_coverage(self) -> float:
         """Calculate overall infrastructure coverage rate."""
-        total_coverage = sum(self.infrastructure_coverage.values())
         max_possible = self.total_population * 5  # 5 types of infrastructure
         
-        return total_coverage / max(1, max_possible)
+        return self.total_coverage / max(1, max_possible)
         
     def calculate_service_access_rate(self) -> float:
         """Calculate percentage of population with access to basic services."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
+        households = self.households
         
-        if not households:
+        if households.size == 0:
             return 0
             
-        households_with_services = 0
-        for h in households:
-            services_count = 0
-            if h.has_road_access():
-                services_count += 1
-            if h.has_market_access():
-                services_count += 1
-            if h.has_utility_access():
-                services_count += 1
-                
-            # Consider having access if 2+ services available
-            if services_count >= 2:
-                households_with_services += 1
-                
-        return households_with_services / len(households)
+        road, market, utility = households.infrastructure_access()
+        services_count = road.astype(np.int64) + market + utility
+            
+        # Consider having access if 2+ services available
+        return float(np.count_nonzero(services_count >= 2)) / households.size
         
     def count_by_sector(self, sector: str) -> int:
         """Count households employed in a specific sector."""
-        households = [agent for agent in self.schedule.agents 
-                     if isinstance(agent, HouseholdAgent)]
-        
-        return sum(1 for h in households if h.sector == sector)
+        return int(np.count_nonzero(self.households.sector == SECTOR_CODES[sector]))
         
     def add_infrastructure(self, pos: Tuple[int, int], infrastructure_type: str) -> bool:
         """Add new infrastructure at specified position."""
         # Check if position is valid and not overcrowded
-        contents = self.grid.get_cell_list_contents([pos])
-        infrastructure_count = sum(1 for agent in contents 
-                                 if isinstance(agent, InfrastructureAgent))
-        
-        if infrastructure_count >= 2:  # Max 2 infrastructure per cell
+        if self.infrastructure_index.total[pos] >= 2:  # Max 2 infrastructure per cell
             return False
             
         # Create new infrastructure
-        new_id = max([agent.unique_id for agent in self.schedule.agents]) + 1
-        infrastructure = InfrastructureAgent(new_id, self, pos, infrastructure_type)
+        infrastructure = InfrastructureAgent(self.next_agent_id, self, pos, infrastructure_type)
+        self.next_agent_id += 1
         
         self.grid.place_agent(infrastructure, pos)
-        self.schedule.add(infrastructure)
+        self.occupancy[pos] += 1
+        self.rebuild_infrastructure_index()
         
         return True
         
+    def collect(self):
+        """Record model reporters and, when due, an agent-level snapshot."""
+        self.datacollector.collect(self)
+        if self.collect_agent_data and self._steps % self.agent_data_interval == 0:
+            snapshot = self.agent_snapshot()
+            if self._agent_data_path is None:
+                self._agent_snapshots.append(snapshot)
+            else:
+                self._write_agent_data(snapshot, header=False)
+                
+    def stream_agent_data(self, path: str):
+        """
+        Write agent-level data to a CSV file as it is collected.
+        
+        Snapshots taken so far are written immediately and later ones are
+        appended at each collection, so memory use no longer grows with the
+        run length. Every row carries its Step and AgentID, so snapshots
+        of different steps can be told apart in the file.
+        """
+        self._agent_data_path = path
+        snapshots = self._agent_snapshots
+        self._agent_snapshots = []
+        self._write_agent_data(pd.concat(snapshots) if snapshots else
+                               pd.DataFrame(columns=list(AGENT_DATA_COLUMNS)), header=True)
+        
+    def _write_agent_data(self, snapshot: pd.DataFrame, header: bool):
+        """Write agent snapshot rows to the streamed CSV file."""
+        snapshot.to_csv(self._agent_data_path, mode='w' if header else 'a', header=header,
+                        index=False, columns=list(AGENT_DATA_COLUMNS))
+            
+    def agent_snapshot(self) -> pd.DataFrame:
+        """
+        Build one row per agent from the population columns.
+        
+        Columns keep the population dtypes, so economic quantities stay
+        float32 in memory and in parquet output.
+        """
+        households = self.households
+        businesses = self.businesses
+        infrastructure = self.infrastructure
+        
+        frames = [
+            self._population_frame(households, 'HouseholdAgent', {
+                "Income": households.income,
+                "Education": households.education_level,
+                "Health": households.health_index,
+                "Sector": np.array(SECTORS, dtype=object)[households.sector],
+                "Savings": households.savings,
+            }),
+            self._population_frame(businesses, 'BusinessAgent', {
+                "Business_Type": np.array(SECTORS, dtype=object)[businesses.business_type],
+                "Business_Size": np.array(BUSINESS_SIZES, dtype=object)[businesses.size_class],
+                "Revenue": businesses.revenue,
+                "Employees": businesses.current_employees,
+            }),
+            self._population_frame(infrastructure, 'InfrastructureAgent', {
+                "Infrastructure_Type": np.array(INFRASTRUCTURE_TYPES, dtype=object)[
+                    infrastructure.infrastructure_type],
+                "Quality": infrastructure.quality,
+                "Coverage_Radius": infrastructure.coverage_radius,
+            }),
+        ]
+        return pd.concat(frames, ignore_index=True)[list(AGENT_DATA_COLUMNS)]
+        
+    def _population_frame(self, population, agent_type: str,
+                          columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Build the snapshot rows of one population."""
+        n = len(population.agents)
+        return pd.DataFrame({
+            "Step": np.full(n, self._steps, dtype=np.int32),
+            "AgentID": np.fromiter((agent.unique_id for agent in population.agents),
+                                   dtype=np.int32, count=n),
+            "Agent_Type": agent_type,
+            "Position_X": population.pos_x[:n],
+            "Position_Y": population.pos_y[:n],
+            **{name: values[:n] for name, values in columns.items()},
+        })
+        
     def get_model_data(self) -> pd.DataFrame:
         """Get model-level data as DataFrame."""
         return self.datacollector.get_model_vars_dataframe()
         
     def get_agent_data(self) -> pd.DataFrame:
-        """Get agent-level data as DataFrame."""
-        return self.datacollector.get_agent_vars_dataframe()
+        """
+        Get agent-level data as DataFrame, indexed by step and agent.
+        
+        When agent data is streamed to a file, the rows are read back from it.
+        """
+        if self._agent_data_path is not None:
+            return pd.read_csv(self._agent_data_path, index_col=["Step", "AgentID"])
+        if not self._agent_snapshots:
+            return pd.DataFrame(columns=list(AGENT_DATA_COLUMNS[2:]),
+                                index=pd.MultiIndex.from_tuples([], names=["Step", "AgentID"]))
+        return pd.concat(self._agent_snapshots).set_index(["Step", "AgentID"])
         
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration parameters."""
@@ -402,5 +540,8 @@ class TownDevelopmentModel(Model):
                 },
                 'grant_program_budget': 20000,
                 'microfinance_budget': 15000
-            }
+            },
+            'collect_agent_data': True,
+            'output_frequency': 1,
+            'random_seed': None
         }
@@ -0,0 +1,95 @@
+"""
+Resolved simulation parameters for the Village to Town simulation.
+
+The model configuration is a nested dictionary loaded from YAML. Agents
+read many of its values on every step, so the values they need are
+resolved once into a frozen parameter record with flat attributes.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from .population import SECTORS
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationParams:
+    """Flat, read-only view of the configuration values used by agents."""
+
+    # Demographics
+    household_size_range: Tuple[int, int]
+    initial_sector_distribution: Tuple[float, float, float]
+
+    # Economic parameters (indexed by sector code)
+    base_wages: Tuple[float, float, float]
+
+    # Financial inclusion and Bangladesh-specific rates
+    microfinance_membership_rate: float
+    offgrid_electric_share: float
+    remittance_receiving_rate: float
+    cooperative_membership_rate: float
+    landless_household_rate: float
+    flood_risk_probability: float
+    rural_urban_wage_multiplier: float
+
+    # Human capital and location preferences
+    education_range: Tuple[int, int]
+    health_range: Tuple[float, float]
+    rural_attachment_range: Tuple[float, float]
+    migration_threshold_range: Tuple[float, float]
+
+    # Productivity multipliers
+    education_factor: float
+    health_factor: float
+    road_multiplier: float
+    market_multiplier: float
+    utility_multiplier: float
+    income_variation: float
+
+    # Economic decisions
+    consumption_rate: float
+    education_cost_multiplier: float
+    education_investment_probability: float
+    health_investment_cost: float
+    health_investment_probability: float
+    health_improvement_per_investment: float
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SimulationParams':
+        """Resolve parameters from a configuration dictionary, applying defaults."""
+        sector_dist = config.get('initial_sector_distribution', {
+            'agriculture': 0.6, 'manufacturing': 0.2, 'services': 0.2
+        })
+        wages = config.get('base_wages', {
+            'agriculture': 2500, 'manufacturing': 4000, 'services': 5000
+        })
+        multipliers = config.get('productivity_multipliers', {})
+
+        return cls(
+            household_size_range=tuple(config.get('household_size_range', [2, 8])),
+            initial_sector_distribution=tuple(sector_dist[name] for name in SECTORS),
+            base_wages=tuple(float(wages[name]) for name in SECTORS),
+            microfinance_membership_rate=config.get('microfinance_membership_rate', 0.3),
+            offgrid_electric_share=config.get('offgrid_electric_share', 0.0),
+            remittance_receiving_rate=config.get('remittance_receiving_rate', 0.0),
+            cooperative_membership_rate=config.get('cooperative_membership_rate', 0.0),
+            landless_household_rate=config.get('landless_household_rate', 0.0),
+            flood_risk_probability=config.get('flood_risk_probability', 0.0),
+            rural_urban_wage_multiplier=config.get('rural_urban_wage_multiplier', 1.0),
+            education_range=tuple(config.get('education_range', [0, 12])),
+            health_range=tuple(config.get('health_range', [0.3, 1.0])),
+            rural_attachment_range=tuple(config.get('rural_attachment_range', [0.2, 0.8])),
+            migration_threshold_range=tuple(config.get('migration_threshold_range', [1.2, 2.0])),
+            education_factor=multipliers.get('education_factor', 0.05),
+            health_factor=multipliers.get('health_factor', 0.5),
+            road_multiplier=multipliers.get('infrastructure_road', 1.2),
+            market_multiplier=multipliers.get('infrastructure_market', 1.15),
+            utility_multiplier=multipliers.get('infrastructure_utility', 1.1),
+            income_variation=config.get('random_variation', {}).get('income', 0.1),
+            consumption_rate=config.get('consumption_rate', 0.8),
+            education_cost_multiplier=config.get('education_cost_multiplier', 500),
+            education_investment_probability=config.get('education_investment_probability', 0.3),
+            health_investment_cost=config.get('health_investment_cost', 200),
+            health_investment_probability=config.get('health_investment_probability', 0.4),
+            health_improvement_per_investment=config.get('health_improvement_per_investment', 0.1),
+        )
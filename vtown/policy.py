@@ -8,9 +8,91 @@ This module implements various policy interventions including:
 - Urban planning policies
 """
 
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from .agents import InfrastructureAgent
+from .population import (
+    AGRICULTURE, BUSINESS_SIZE_CODES, INFRASTRUCTURE_CODES, INFRASTRUCTURE_COST, MANUFACTURING,
+    SERVICES
+)
+from .spatial import INFRASTRUCTURE_TYPES, moore_offsets
+
+
+# Target infrastructure per 100 people, indexed by type code: 1 road per 200
+# people, 1 school per 400, 1 clinic per 500, 1 market per 667 and 1 utility
+# per 333
+INFRASTRUCTURE_TARGET_RATIOS = (0.5, 0.25, 0.2, 0.15, 0.3)
+
+# Radius of the neighborhood scored around candidate road locations
+ROAD_SCORE_RADIUS = 5
+
+# (dx, dy, distance) for each cell of the road scoring window
+_ROAD_SCORE_OFFSETS = tuple((dx, dy, max(1, math.sqrt(dx*dx + dy*dy)))
+                            for dx in range(-ROAD_SCORE_RADIUS, ROAD_SCORE_RADIUS + 1)
+                            for dy in range(-ROAD_SCORE_RADIUS, ROAD_SCORE_RADIUS + 1))
+
+
+def _smallest(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the indices of the k smallest values.
+
+    Ties are broken by position, so the selection matches the first k
+    elements of a stable sort, found by a partial sort in linear time.
+    """
+    if k >= len(values):
+        return np.arange(len(values))
+    if k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    kth = np.partition(values, k - 1)[k - 1]
+    below = np.flatnonzero(values < kth)
+    ties = np.flatnonzero(values == kth)[:k - below.size]
+    return np.concatenate([below, ties])
+
+
+class PolicyHistory:
+    """
+    Columnar log of annual policy outcomes.
+
+    Each year appends one row of scalars. Columns are float64 arrays backed
+    by buffers whose capacity doubles when full, and ``history[column]`` is
+    a view of the years recorded so far. A column missing from a year's
+    record holds NaN for that year.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self):
+        self.size = 0
+        self._capacity = self._INITIAL_CAPACITY
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._buffers[column][:self.size]
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Column names, in the order they were first recorded."""
+        return tuple(self._buffers)
+
+    def append(self, record: Dict[str, float]):
+        """Append one year's record, growing the buffers when they are full."""
+        index = self.size
+        if index == self._capacity:
+            self._capacity *= 2
+            for name, buffer in self._buffers.items():
+                self._buffers[name] = np.resize(buffer, self._capacity)
+        for name in self._buffers.keys() - record.keys():
+            self._buffers[name][index] = np.nan
+        for name, value in record.items():
+            buffer = self._buffers.get(name)
+            if buffer is None:
+                buffer = self._buffers[name] = np.full(self._capacity, np.nan)
+            buffer[index] = value
+        self.size += 1
 
 
 class PolicyEngine:
@@ -36,8 +118,9 @@ class PolicyEngine:
         self.grant_program_budget = config.get('grant_program_budget', 20000)
         self.microfinance_budget = config.get('microfinance_budget', 15000)
         
-        # Policy history for adaptive strategies
-        self.policy_history = []
+        # Policy history for adaptive strategies, kept as one array per
+        # column rather than one nested record per year
+        self.policy_history = PolicyHistory()
         self.effectiveness_scores = {}
         
     def execute_annual_policies(self):
@@ -70,43 +153,60 @@ class PolicyEngine:
         )
         
         # Record policy execution
-        self.policy_history.append({
-            'step': self.model.step_count,
-            'budget_allocation': budget_allocation,
-            'results': results,
-            'situation': situation_assessment
-        })
+        self.record_policy_history(budget_allocation, results, situation_assessment)
         
         # Update policy effectiveness
         self.update_policy_effectiveness()
         
+    def record_policy_history(self, budget_allocation: Dict[str, float],
+                              results: Dict[str, Dict[str, Any]], situation: Dict[str, Any]):
+        """
+        Append the outcomes of one year to the policy history.
+        
+        Columns are the step, the budget of each area (``<area>_budget``),
+        each scalar program result (``<area>_<result>``), the number of
+        projects built of each infrastructure type
+        (``infrastructure_built_<type>``), each situation indicator
+        (``situation_<indicator>``) and the infrastructure count of each type
+        (``situation_infrastructure_coverage_<type>``).
+        """
+        record = {'step': self.model.step_count}
+        record.update({f'{area}_budget': amount for area, amount in budget_allocation.items()})
+        record.update({f'{area}_{key}': value
+                       for area, area_results in results.items()
+                       for key, value in area_results.items() if not isinstance(value, list)})
+        types_built = results['infrastructure']['types_built']
+        record.update({f'infrastructure_built_{infra_type}': types_built.count(infra_type)
+                       for infra_type in INFRASTRUCTURE_TYPES})
+        for key, value in situation.items():
+            if isinstance(value, dict):
+                record.update({f'situation_{key}_{name}': count for name, count in value.items()})
+            else:
+                record[f'situation_{key}'] = value
+        
+        self.policy_history.append(record)
+            
     def assess_current_situation(self) -> Dict[str, float]:
         """Assess current development situation to guide policy priorities."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
-        businesses = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'business_type')]
-        infrastructure = [agent for agent in self.model.schedule.agents 
-                         if hasattr(agent, 'infrastructure_type')]
+        households = self.model.households
         
         assessment = {}
         
-        # Economic indicators
-        if households:
-            avg_income = sum(h.income for h in households) / len(households)
+        # Economic indicators, each a single pass over a household column
+        if households.size:
+            avg_income = float(households.income.mean(dtype=np.float64))
             assessment['economic_development'] = min(1.0, avg_income / 5000)
             
             # Sector distribution
-            agriculture_pct = sum(1 for h in households if h.sector == 'agriculture') / len(households)
+            agriculture_pct = np.count_nonzero(households.sector == AGRICULTURE) / households.size
             assessment['agricultural_dependency'] = agriculture_pct
             
             # Education level
-            avg_education = sum(h.education_level for h in households) / len(households)
+            avg_education = int(households.education_level.sum()) / households.size
             assessment['education_level'] = avg_education / 12
             
             # Health level
-            avg_health = sum(h.health_index for h in households) / len(households)
-            assessment['health_level'] = avg_health
+            assessment['health_level'] = float(households.health_index.mean(dtype=np.float64))
         else:
             assessment.update({
                 'economic_development': 0,
@@ -116,18 +216,14 @@ class PolicyEngine:
             })
         
         # Infrastructure coverage
-        infrastructure_coverage = {}
-        for infra_type in ['road', 'school', 'clinic', 'market', 'utility']:
-            count = sum(1 for i in infrastructure if i.infrastructure_type == infra_type)
-            infrastructure_coverage[infra_type] = count
-            
-        assessment['infrastructure_coverage'] = infrastructure_coverage
+        counts = self.model.infrastructure.type_counts()
+        assessment['infrastructure_coverage'] = dict(zip(INFRASTRUCTURE_TYPES, counts.tolist()))
         
         # Urbanization level
         assessment['urbanization_rate'] = self.model.calculate_urbanization_rate()
         
         # Business development
-        assessment['business_density'] = len(businesses) / max(1, len(households))
+        assessment['business_density'] = self.model.businesses.size / max(1, households.size)
         
         return assessment
         
@@ -201,18 +297,19 @@ class PolicyEngine:
                 break
                 
             # Determine how many to build based on budget and priority
-            construction_cost = {
-                'road': 10000, 'school': 50000, 'clinic': 30000,
-                'market': 20000, 'utility': 40000
-            }[infra_type]
+            construction_cost = int(INFRASTRUCTURE_COST[INFRASTRUCTURE_CODES[infra_type]])
             
             max_buildable = int(remaining_budget // construction_cost)
             target_builds = min(max_buildable, max(1, int(priority_score * 3)))
             
+            # Households do not move while building, so the road score map
+            # is computed once for the batch and only availability changes
+            road_scores = self.road_score_grid() if infra_type == 'road' and target_builds else None
+            
             built_count = 0
             for _ in range(target_builds):
                 if remaining_budget >= construction_cost:
-                    location = self.find_optimal_infrastructure_location(infra_type)
+                    location = self.find_optimal_infrastructure_location(infra_type, road_scores)
                     if location and self.model.add_infrastructure(location, infra_type):
                         remaining_budget -= construction_cost
                         built_count += 1
@@ -226,32 +323,19 @@ class PolicyEngine:
         
     def assess_infrastructure_needs(self) -> Dict[str, float]:
         """Assess relative need for different infrastructure types."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
-        infrastructure = [agent for agent in self.model.schedule.agents 
-                         if hasattr(agent, 'infrastructure_type')]
+        population = self.model.households.size
         
         needs = {}
         
-        if not households:
+        if not population:
             return {'road': 1.0, 'school': 1.0, 'clinic': 1.0, 'market': 1.0, 'utility': 1.0}
         
-        population = len(households)
-        
         # Calculate coverage ratios
-        for infra_type in ['road', 'school', 'clinic', 'market', 'utility']:
-            current_count = sum(1 for i in infrastructure if i.infrastructure_type == infra_type)
-            
-            # Target ratios (infrastructure per 100 people)
-            target_ratios = {
-                'road': 0.5,     # 1 road per 200 people
-                'school': 0.25,  # 1 school per 400 people  
-                'clinic': 0.2,   # 1 clinic per 500 people
-                'market': 0.15,  # 1 market per 667 people
-                'utility': 0.3   # 1 utility per 333 people
-            }
-            
-            target_count = (population / 100) * target_ratios[infra_type]
+        counts = self.model.infrastructure.type_counts()
+        for code, infra_type in enumerate(INFRASTRUCTURE_TYPES):
+            current_count = int(counts[code])
+            
+            target_count = (population / 100) * INFRASTRUCTURE_TARGET_RATIOS[code]
             coverage_ratio = current_count / max(1, target_count)
             
             # Need is inverse of coverage (higher need = lower coverage)
@@ -259,19 +343,22 @@ class PolicyEngine:
             
         return needs
         
-    def find_optimal_infrastructure_location(self, infra_type: str) -> Tuple[int, int]:
-        """Find optimal location for new infrastructure."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+    def find_optimal_infrastructure_location(self, infra_type: str,
+                                             road_scores: Optional[np.ndarray] = None) -> Tuple[int, int]:
+        """
+        Find optimal location for new infrastructure.
         
-        if not households:
+        ``road_scores`` may pass a score map from ``road_score_grid()`` to
+        reuse across several road placements.
+        """
+        if not self.model.households.size:
             # Default to center if no households
             return (self.model.grid.width // 2, self.model.grid.height // 2)
             
         # Strategy depends on infrastructure type
         if infra_type == 'road':
             # Roads should connect population centers
-            return self.find_road_connection_point()
+            return self.find_road_connection_point(road_scores)
         elif infra_type in ['school', 'clinic']:
             # Schools and clinics should be central to underserved areas
             return self.find_underserved_population_center(infra_type)
@@ -285,79 +372,63 @@ class PolicyEngine:
         # Default fallback
         return self.find_population_weighted_center()
         
-    def find_road_connection_point(self) -> Tuple[int, int]:
+    def find_road_connection_point(self, scores: Optional[np.ndarray] = None) -> Tuple[int, int]:
         """Find location that connects population clusters."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
-        
-        # Find population density clusters
-        density_map = np.zeros((self.model.grid.width, self.model.grid.height))
-        
-        for h in households:
-            x, y = h.pos
-            # Add density in 3x3 area around household
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < self.model.grid.width and 0 <= ny < self.model.grid.height:
-                        density_map[nx, ny] += 1
-                        
-        # Find location with good connectivity potential
-        best_score = -1
-        best_location = None
-        
-        for x in range(self.model.grid.width):
-            for y in range(self.model.grid.height):
-                # Check if location is available
-                contents = self.model.grid.get_cell_list_contents([(x, y)])
-                infrastructure_count = sum(1 for agent in contents 
-                                         if hasattr(agent, 'infrastructure_type'))
-                
-                if infrastructure_count >= 2:
-                    continue
-                    
-                # Score based on nearby population and connectivity
-                score = 0
-                for dx in range(-5, 6):
-                    for dy in range(-5, 6):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.model.grid.width and 0 <= ny < self.model.grid.height:
-                            distance = max(1, np.sqrt(dx*dx + dy*dy))
-                            score += density_map[nx, ny] / distance
-                            
-                if score > best_score:
-                    best_score = score
-                    best_location = (x, y)
-                    
-        return best_location or (self.model.grid.width // 2, self.model.grid.height // 2)
+        width, height = self.model.grid.width, self.model.grid.height
+        if scores is None:
+            scores = self.road_score_grid()
+            
+        # Only locations that are still available can be chosen
+        available = self.model.infrastructure_index.total < 2
+        if not available.any():
+            return (width // 2, height // 2)
+            
+        best = np.argmax(np.where(available, scores, -1))
+        return tuple(int(v) for v in np.unravel_index(best, (width, height)))
+        
+    def road_score_grid(self) -> np.ndarray:
+        """Score every location by how well a road there would connect population."""
+        households = self.model.households
+        width, height = self.model.grid.width, self.model.grid.height
+        
+        # Find population density clusters: each household adds density to
+        # the 3x3 area around it
+        counts = np.zeros((width + 2, height + 2))
+        np.add.at(counts, (households.pos_x + 1, households.pos_y + 1), 1)
+        density_map = sum(counts[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+                          for dx in range(-1, 2) for dy in range(-1, 2))
+        
+        # Score every location by nearby population, weighted by inverse
+        # distance; the padding contributes nothing outside the grid
+        padded = np.pad(density_map, ROAD_SCORE_RADIUS)
+        scores = np.zeros((width, height))
+        for dx, dy, distance in _ROAD_SCORE_OFFSETS:
+            scores += padded[ROAD_SCORE_RADIUS + dx:ROAD_SCORE_RADIUS + dx + width,
+                             ROAD_SCORE_RADIUS + dy:ROAD_SCORE_RADIUS + dy + height] / distance
+        return scores
         
     def find_underserved_population_center(self, infra_type: str) -> Tuple[int, int]:
         """Find center of population underserved by specific infrastructure."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
-        infrastructure = [agent for agent in self.model.schedule.agents 
-                         if hasattr(agent, 'infrastructure_type') and 
-                         agent.infrastructure_type == infra_type]
-        
-        # Find households without access to this infrastructure type
-        underserved = []
-        for h in households:
-            has_access = False
-            for infra in infrastructure:
-                distance = np.sqrt((h.pos[0] - infra.pos[0])**2 + (h.pos[1] - infra.pos[1])**2)
-                if distance <= infra.coverage_radius:
-                    has_access = True
-                    break
-            if not has_access:
-                underserved.append(h)
-                
-        if not underserved:
+        households = self.model.households
+        infrastructure = self.model.infrastructure
+        of_type = infrastructure.infrastructure_type == INFRASTRUCTURE_CODES[infra_type]
+        infra_x = infrastructure.pos_x[of_type].astype(np.int64)
+        infra_y = infrastructure.pos_y[of_type].astype(np.int64)
+        radius = infrastructure.coverage_radius[of_type].astype(np.int64)
+        
+        # Find households outside the coverage radius of every element of
+        # this type, comparing squared distances for all pairs at once
+        distance_sq = ((households.pos_x[None, :] - infra_x[:, None])**2 +
+                       (households.pos_y[None, :] - infra_y[:, None])**2)
+        underserved = ~(distance_sq <= (radius**2)[:, None]).any(axis=0)
+        
+        if not underserved.any():
             # If everyone has access, find general population center
             return self.find_population_weighted_center()
             
         # Find center of underserved population
-        center_x = sum(h.pos[0] for h in underserved) / len(underserved)
-        center_y = sum(h.pos[1] for h in underserved) / len(underserved)
+        center_x = households.pos_x[underserved].mean(dtype=np.float64)
+        center_y = households.pos_y[underserved].mean(dtype=np.float64)
         
         # Find nearest valid grid position
         x = int(round(center_x))
@@ -369,99 +440,70 @@ class PolicyEngine:
         
     def find_high_accessibility_location(self) -> Tuple[int, int]:
         """Find location with high accessibility to population."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
-        
-        best_score = -1
-        best_location = None
+        households = self.model.households
         
-        # Sample locations and find one with best accessibility
-        for _ in range(50):  # Sample 50 random locations
-            x = np.random.randint(0, self.model.grid.width)
-            y = np.random.randint(0, self.model.grid.height)
-            
-            # Check if location is available
-            contents = self.model.grid.get_cell_list_contents([(x, y)])
-            infrastructure_count = sum(1 for agent in contents 
-                                     if hasattr(agent, 'infrastructure_type'))
+        # Sample up to 50 distinct locations among those still available
+        available = np.flatnonzero(self.model.infrastructure_index.total.ravel() < 2)
+        if available.size == 0:
+            return (self.model.grid.width // 2, self.model.grid.height // 2)
             
-            if infrastructure_count >= 2:
-                continue
-                
-            # Calculate accessibility score
-            accessibility = 0
-            for h in households:
-                distance = np.sqrt((x - h.pos[0])**2 + (y - h.pos[1])**2)
-                accessibility += 1 / max(1, distance)
-                
-            if accessibility > best_score:
-                best_score = accessibility
-                best_location = (x, y)
-                
-        return best_location or (self.model.grid.width // 2, self.model.grid.height // 2)
+        candidates = self.model.rng.choice(available, size=min(50, available.size), replace=False)
+        candidate_x, candidate_y = np.unravel_index(candidates, (self.model.grid.width,
+                                                                 self.model.grid.height))
+        
+        # Accessibility of each candidate to every household at once
+        distance = np.sqrt((candidate_x[:, None] - households.pos_x[None, :])**2 +
+                           (candidate_y[:, None] - households.pos_y[None, :])**2)
+        accessibility = (1 / np.maximum(1, distance)).sum(axis=1)
+        
+        best = np.argmax(accessibility)
+        return (int(candidate_x[best]), int(candidate_y[best]))
         
     def find_utility_expansion_point(self) -> Tuple[int, int]:
         """Find location to expand utility network."""
-        existing_utilities = [agent for agent in self.model.schedule.agents 
-                             if hasattr(agent, 'infrastructure_type') and 
-                             agent.infrastructure_type == 'utility']
+        infrastructure = self.model.infrastructure
+        is_utility = infrastructure.infrastructure_type == INFRASTRUCTURE_CODES['utility']
         
-        if not existing_utilities:
+        if not is_utility.any():
             # If no existing utilities, place at population center
             return self.find_population_weighted_center()
             
-        # Find location near existing utilities but serving new areas
-        best_location = None
-        best_score = -1
-        
-        for utility in existing_utilities:
-            # Look for expansion points around existing utilities
-            for dx in range(-3, 4):
-                for dy in range(-3, 4):
-                    if dx == 0 and dy == 0:
-                        continue
-                        
-                    x = utility.pos[0] + dx
-                    y = utility.pos[1] + dy
-                    
-                    if not (0 <= x < self.model.grid.width and 0 <= y < self.model.grid.height):
-                        continue
-                        
-                    # Check availability
-                    contents = self.model.grid.get_cell_list_contents([(x, y)])
-                    infrastructure_count = sum(1 for agent in contents 
-                                             if hasattr(agent, 'infrastructure_type'))
-                    
-                    if infrastructure_count >= 2:
-                        continue
-                        
-                    # Score based on nearby underserved population
-                    score = 0
-                    households = [agent for agent in self.model.schedule.agents 
-                                 if hasattr(agent, 'sector')]
-                    
-                    for h in households:
-                        if not h.has_utility_access():
-                            distance = np.sqrt((x - h.pos[0])**2 + (y - h.pos[1])**2)
-                            if distance <= 3:  # Within utility coverage
-                                score += 1
-                                
-                    if score > best_score:
-                        best_score = score
-                        best_location = (x, y)
-                        
-        return best_location or self.find_population_weighted_center()
+        # Look for expansion points around existing utilities, in the order
+        # utilities were built
+        offsets = moore_offsets(3)
+        candidate_x = (infrastructure.pos_x[is_utility, None] + offsets[:, 0]).ravel()
+        candidate_y = (infrastructure.pos_y[is_utility, None] + offsets[:, 1]).ravel()
+        inside = ((candidate_x >= 0) & (candidate_x < self.model.grid.width) &
+                  (candidate_y >= 0) & (candidate_y < self.model.grid.height))
+        candidate_x, candidate_y = candidate_x[inside], candidate_y[inside]
+        available = self.model.infrastructure_index.total[candidate_x, candidate_y] < 2
+        candidate_x, candidate_y = candidate_x[available], candidate_y[available]
+        
+        if candidate_x.size == 0:
+            return self.find_population_weighted_center()
+            
+        # Score based on nearby underserved population: households without
+        # utility access within utility coverage (radius 3)
+        households = self.model.households
+        _, _, utility_access = households.infrastructure_access()
+        unserved_x = households.pos_x[~utility_access]
+        unserved_y = households.pos_y[~utility_access]
+        distance_sq = ((candidate_x[:, None] - unserved_x[None, :])**2 +
+                       (candidate_y[:, None] - unserved_y[None, :])**2)
+        scores = np.count_nonzero(distance_sq <= 9, axis=1)
+        
+        best = np.argmax(scores)
+        return (int(candidate_x[best]), int(candidate_y[best]))
         
     def find_population_weighted_center(self) -> Tuple[int, int]:
         """Find population-weighted center of the settlement."""
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+        households = self.model.households
         
-        if not households:
+        if not households.size:
             return (self.model.grid.width // 2, self.model.grid.height // 2)
             
-        center_x = sum(h.pos[0] for h in households) / len(households)
-        center_y = sum(h.pos[1] for h in households) / len(households)
+        center_x = households.pos_x.mean(dtype=np.float64)
+        center_y = households.pos_y.mean(dtype=np.float64)
         
         x = int(round(center_x))
         y = int(round(center_y))
@@ -474,23 +516,20 @@ class PolicyEngine:
         """Implement education improvement programs."""
         results = {'beneficiaries': 0, 'total_cost': 0}
         
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+        households = self.model.households
         
         # Target households with low education
         cost_per_beneficiary = 300
         max_beneficiaries = int(budget // cost_per_beneficiary)
         
-        eligible_households = [h for h in households if h.education_level < 10]
-        beneficiaries = min(max_beneficiaries, len(eligible_households))
+        eligible = np.flatnonzero(households.education_level < 10)
+        beneficiaries = min(max_beneficiaries, eligible.size)
         
         # Select beneficiaries (prioritize lowest education)
-        eligible_households.sort(key=lambda h: h.education_level)
-        selected = eligible_households[:beneficiaries]
+        selected = eligible[_smallest(households.education_level[eligible], beneficiaries)]
         
         # Apply education boost
-        for household in selected:
-            household.education_level = min(12, household.education_level + 1)
+        households.education_level[selected] = np.minimum(12, households.education_level[selected] + 1)
             
         results['beneficiaries'] = beneficiaries
         results['total_cost'] = beneficiaries * cost_per_beneficiary
@@ -501,23 +540,20 @@ class PolicyEngine:
         """Implement health improvement programs."""
         results = {'beneficiaries': 0, 'total_cost': 0}
         
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+        households = self.model.households
         
         # Target households with low health
         cost_per_beneficiary = 250
         max_beneficiaries = int(budget // cost_per_beneficiary)
         
-        eligible_households = [h for h in households if h.health_index < 0.8]
-        beneficiaries = min(max_beneficiaries, len(eligible_households))
+        eligible = np.flatnonzero(households.health_index < 0.8)
+        beneficiaries = min(max_beneficiaries, eligible.size)
         
         # Select beneficiaries (prioritize lowest health)
-        eligible_households.sort(key=lambda h: h.health_index)
-        selected = eligible_households[:beneficiaries]
+        selected = eligible[_smallest(households.health_index[eligible], beneficiaries)]
         
         # Apply health boost
-        for household in selected:
-            household.health_index = min(1.0, household.health_index + 0.15)
+        households.health_index[selected] = np.minimum(1.0, households.health_index[selected] + 0.15)
             
         results['beneficiaries'] = beneficiaries
         results['total_cost'] = beneficiaries * cost_per_beneficiary
@@ -528,10 +564,8 @@ class PolicyEngine:
         """Implement economic development programs."""
         results = {'businesses_supported': 0, 'training_provided': 0, 'total_cost': 0}
         
-        businesses = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'business_type')]
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+        businesses = self.model.businesses
+        households = self.model.households
         
         remaining_budget = budget
         
@@ -540,12 +574,12 @@ class PolicyEngine:
         max_business_grants = int(remaining_budget * 0.6 // business_grant)
         
         # Prioritize small businesses
-        small_businesses = [b for b in businesses if b.size == 'small']
-        grants_given = min(max_business_grants, len(small_businesses))
+        small_businesses = np.flatnonzero(businesses.size_class == BUSINESS_SIZE_CODES['small'])
+        grants_given = min(max_business_grants, small_businesses.size)
         
-        for i in range(grants_given):
-            small_businesses[i].capital += business_grant
-            small_businesses[i].productivity += 0.1
+        supported = small_businesses[:grants_given]
+        businesses.capital[supported] += business_grant
+        businesses.productivity[supported] += 0.1
             
         results['businesses_supported'] = grants_given
         remaining_budget -= grants_given * business_grant
@@ -555,13 +589,15 @@ class PolicyEngine:
         max_training = int(remaining_budget // training_cost)
         
         # Target agricultural workers for sector transition
-        agricultural_workers = [h for h in households if h.sector == 'agriculture' and h.education_level >= 5]
-        training_provided = min(max_training, len(agricultural_workers))
-        
-        for i in range(training_provided):
-            # Increase chance of sector transition
-            if np.random.random() < 0.3:
-                agricultural_workers[i].sector = np.random.choice(['manufacturing', 'services'])
+        agricultural_workers = np.flatnonzero((households.sector == AGRICULTURE) &
+                                              (households.education_level >= 5))
+        training_provided = min(max_training, agricultural_workers.size)
+        
+        # Increase chance of sector transition, drawing for all trainees at once
+        trained = agricultural_workers[:training_provided]
+        transitioning = trained[self.model.rng.random(training_provided) < 0.3]
+        households.sector[transitioning] = self.model.rng.choice([MANUFACTURING, SERVICES],
+                                                                 size=transitioning.size)
                 
         results['training_provided'] = training_provided
         results['total_cost'] = (grants_given * business_grant) + (training_provided * training_cost)
@@ -572,20 +608,18 @@ class PolicyEngine:
         """Implement direct grants and microfinance programs."""
         results = {'direct_grants': 0, 'microfinance_loans': 0, 'total_cost': 0}
         
-        households = [agent for agent in self.model.schedule.agents 
-                     if hasattr(agent, 'sector')]
+        households = self.model.households
         
         # Direct grants for poorest households
         grant_amount = self.model.config.get('policy_config', {}).get('direct_grant_amount', 1000)
         max_grants = int(budget * 0.4 // grant_amount)
         
         # Target lowest income households
-        poor_households = [h for h in households if h.income < 2000]
-        grants_given = min(max_grants, len(poor_households))
+        poor_households = np.flatnonzero(households.income < 2000)
+        grants_given = min(max_grants, poor_households.size)
         
-        poor_households.sort(key=lambda h: h.income)
-        for i in range(grants_given):
-            poor_households[i].savings += grant_amount
+        selected = poor_households[_smallest(households.income[poor_households], grants_given)]
+        households.savings[selected] += grant_amount
             
         results['direct_grants'] = grants_given
         
@@ -595,12 +629,11 @@ class PolicyEngine:
         max_loans = int(remaining_budget // loan_amount)
         
         # Target households with some savings but limited capital
-        eligible_for_loans = [h for h in households if 500 <= h.savings <= 3000]
-        loans_given = min(max_loans, len(eligible_for_loans))
+        eligible_for_loans = np.flatnonzero((households.savings >= 500) & (households.savings <= 3000))
+        loans_given = min(max_loans, eligible_for_loans.size)
         
-        for i in range(loans_given):
-            eligible_for_loans[i].savings += loan_amount
-            # Note: In a more complex model, we'd track loan repayment
+        # Note: In a more complex model, we'd track loan repayment
+        households.savings[eligible_for_loans[:loans_given]] += loan_amount
             
         results['microfinance_loans'] = loans_given
         results['total_cost'] = (grants_given * grant_amount) + (loans_given * loan_amount)
@@ -0,0 +1,624 @@
+"""
+Array-backed agent populations for the Village to Town simulation.
+
+Agent state is stored as parallel NumPy arrays (one array per attribute)
+owned by the model, one population per agent type. Agent objects are thin
+views into these arrays, and each population's step applies the per-step
+decisions to all of its agents at once instead of one agent at a time.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+from .spatial import INFRASTRUCTURE_TYPES, moore_offsets
+
+# Sector codes used in the household arrays
+AGRICULTURE = 0
+MANUFACTURING = 1
+SERVICES = 2
+SECTORS = ('agriculture', 'manufacturing', 'services')
+SECTOR_CODES = {name: code for code, name in enumerate(SECTORS)}
+
+# Gender codes of the household head
+GENDERS = ('male', 'female')
+
+# Business size classes and their employee limits
+BUSINESS_SIZES = ('small', 'medium', 'large')
+BUSINESS_SIZE_CODES = {name: code for code, name in enumerate(BUSINESS_SIZES)}
+MAX_EMPLOYEES = np.array([5, 20, 50])
+# Mean and standard deviation of starting capital by size class
+CAPITAL_DISTRIBUTION = ((5000, 2000), (20000, 10000), (50000, 20000))
+
+# Monthly base revenue by business sector
+BASE_REVENUE = np.array([1000.0, 2000.0, 1500.0], dtype=np.float32)
+
+INFRASTRUCTURE_CODES = {name: code for code, name in enumerate(INFRASTRUCTURE_TYPES)}
+# Per-type infrastructure characteristics, indexed by type code
+INFRASTRUCTURE_COVERAGE = np.array([1, 3, 4, 5, 2])
+# Roads: traffic, schools: students, clinics: patients per month,
+# markets: vendors, utilities: connections
+INFRASTRUCTURE_CAPACITY = np.array([1000, 200, 100, 50, 500])
+INFRASTRUCTURE_COST = np.array([10000, 50000, 30000, 20000, 40000])
+# Productivity bonus of infrastructure at full quality
+INFRASTRUCTURE_BONUS = np.array([0.2, 0.15, 0.1, 0.25, 0.2], dtype=np.float32)
+
+# Bits of the household flags field
+FLAG_MICROFINANCE = 1
+FLAG_OFFGRID = 2
+FLAG_REMITTANCES = 4
+FLAG_COOPERATIVE = 8
+FLAG_LANDLESS = 16
+FLAG_FLOOD = 32
+FLAGS = (FLAG_MICROFINANCE, FLAG_OFFGRID, FLAG_REMITTANCES, FLAG_COOPERATIVE,
+         FLAG_LANDLESS, FLAG_FLOOD)
+
+
+class HouseholdPopulation:
+    """
+    Structure-of-arrays store for all households in the model.
+
+    Each household attribute is a NumPy array indexed by the household's
+    position in the population. The step phases mirror the decisions of
+    a single household (floods, income, migration, investments, sector
+    changes) but operate on every household in one vectorized pass.
+
+    Economic quantities are stored as float32 to halve memory traffic;
+    aggregates over them should accumulate in float64.
+    """
+
+    def __init__(self, model, size: int):
+        self.model = model
+        self.size = size
+        self.agents: List = []
+
+        # Sector-specific income factors, indexed by sector code, so the
+        # income update gathers them instead of branching on the sector
+        params = model.params
+        self.wage_lut = np.array(params.base_wages, dtype=np.float32)
+        # Landless households in agriculture have lower income
+        self.landless_factor_lut = np.array([0.7, 1.0, 1.0], dtype=np.float32)
+        # Urban premium for non-agriculture
+        self.urban_premium_lut = np.array(
+            [1.0, params.rural_urban_wage_multiplier, params.rural_urban_wage_multiplier],
+            dtype=np.float32
+        )
+
+        # Demographics
+        self.household_size = np.zeros(size, dtype=np.int8)
+        self.age_head = np.zeros(size, dtype=np.int8)
+        self.gender_head = np.zeros(size, dtype=np.int8)
+
+        # Economic status
+        self.sector = np.zeros(size, dtype=np.int8)
+        self.income = np.zeros(size, dtype=np.float32)
+        self.savings = np.zeros(size, dtype=np.float32)
+
+        # Inclusion and flood flags, one FLAG_* bit each
+        self.flags = np.zeros(size, dtype=np.uint8)
+
+        # Bangladesh-specific attributes
+        self.last_flood_step = np.full(size, -1, dtype=np.int32)
+
+        # Human capital
+        self.education_level = np.zeros(size, dtype=np.int8)
+        self.health_index = np.zeros(size, dtype=np.float32)
+
+        # Location and preferences
+        self.pos_x = np.full(size, -1, dtype=np.int16)
+        self.pos_y = np.full(size, -1, dtype=np.int16)
+        self.rural_attachment = np.zeros(size, dtype=np.float32)
+        self.migration_threshold = np.zeros(size, dtype=np.float32)
+
+        # Behavioral parameters
+        self.risk_tolerance = np.zeros(size, dtype=np.float32)
+        self.social_capital = np.zeros(size, dtype=np.float32)
+
+    def initialize(self):
+        """
+        Draw the initial attributes of every household in bulk.
+
+        Each attribute is one vectorized draw over the whole population
+        rather than one scalar draw per household constructor.
+        """
+        params = self.model.params
+        rng = self.model.rng
+        size = self.size
+
+        # Demographics
+        min_hh, max_hh = params.household_size_range
+        self.household_size[:] = rng.integers(min_hh, max_hh + 1, size)
+        self.age_head[:] = rng.integers(20, 65, size)
+        self.gender_head[:] = rng.choice(len(GENDERS), size, p=[0.7, 0.3])
+
+        # Economic status
+        self.sector[:] = rng.choice(len(SECTORS), size, p=params.initial_sector_distribution)
+        # Initialize income around sector wage
+        wage = np.asarray(params.base_wages)[self.sector]
+        income = rng.normal(wage, wage * 0.15)
+        self.income[:] = income
+        self.savings[:] = np.maximum(0, rng.normal(income * 1.0, income * 0.6))
+
+        # Inclusion flags
+        rates = (params.microfinance_membership_rate, params.offgrid_electric_share,
+                 params.remittance_receiving_rate, params.cooperative_membership_rate,
+                 params.landless_household_rate)
+        draws = rng.random((len(rates), size))
+        self.flags[:] = 0
+        for flag, rate, draw in zip(FLAGS, rates, draws):
+            self.flags[draw < rate] |= flag
+
+        # Bangladesh-specific attributes
+        self.last_flood_step[:] = -1
+
+        # Human capital
+        edu_min, edu_max = params.education_range
+        self.education_level[:] = rng.integers(edu_min, edu_max + 1, size)  # Years of education
+        self.health_index[:] = rng.uniform(*params.health_range, size)  # 0-1 health index
+
+        # Location preferences
+        self.rural_attachment[:] = rng.uniform(*params.rural_attachment_range, size)
+        self.migration_threshold[:] = rng.uniform(*params.migration_threshold_range, size)
+
+        # Behavioral parameters
+        self.risk_tolerance[:] = rng.uniform(0.1, 0.9, size)
+        self.social_capital[:] = rng.uniform(0.1, 1.0, size)
+
+    def register(self, agent) -> int:
+        """Register a household view and return its index into the arrays."""
+        index = len(self.agents)
+        if index >= self.size:
+            raise ValueError(f"Household population is full ({self.size} households)")
+        self.agents.append(agent)
+        return index
+
+    def has_flag(self, flag: int) -> np.ndarray:
+        """Return a mask of households with the given FLAG_* bit set."""
+        return (self.flags & flag) != 0
+
+    def flag_masks(self) -> Dict[int, np.ndarray]:
+        """Unpack every flag bit into a boolean mask, keyed by FLAG_* value."""
+        bits = np.unpackbits(self.flags[None, :], axis=0, count=len(FLAGS), bitorder='little')
+        bits = bits.view(bool)
+        return {flag: bits[bit] for bit, flag in enumerate(FLAGS)}
+
+    def step(self):
+        """Execute one step of household decision-making for all households."""
+        self.check_flood_effects()
+
+        # Flags only change in the flood phase, so they are decoded once and
+        # shared by the remaining phases
+        masks = self.flag_masks()
+        self.update_income(masks)
+        self.consider_migration()
+        self.make_education_investment(masks)
+        self.make_health_investment(masks)
+        self.consider_sector_change(masks)
+
+    def is_urban(self) -> np.ndarray:
+        """Return a mask of households living within the urban radius."""
+        return self.model.is_urban[self.pos_x, self.pos_y]
+
+    def infrastructure_access(self, offgrid: Optional[np.ndarray] = None):
+        """
+        Return road, market and utility access masks for all households.
+
+        Off-grid electricity counts as utility access; ``offgrid`` may pass
+        an already decoded FLAG_OFFGRID mask.
+        """
+        if offgrid is None:
+            offgrid = self.has_flag(FLAG_OFFGRID)
+        index = self.model.infrastructure_index
+        # Roads and utilities share the same radius, so one window serves both
+        road_access, utility_access = index.has_access(('road', 'utility'),
+                                                       self.pos_x, self.pos_y, 2)
+        market_access = index.has_access('market', self.pos_x, self.pos_y, 3)
+        return road_access, market_access, offgrid | utility_access
+
+    def check_flood_effects(self):
+        """Apply flood occurrence and recovery to all households."""
+        flood_prob = self.model.params.flood_risk_probability
+        step_count = self.model.step_count
+
+        flood_affected = self.has_flag(FLAG_FLOOD)
+        flooded = (self.model.rng.random(self.size) < flood_prob) & ~flood_affected
+        # Recovery after 1 year (5 steps)
+        recovered = flood_affected & ((step_count - self.last_flood_step) > 5)
+
+        self.flags[flooded] |= FLAG_FLOOD
+        self.last_flood_step[flooded] = step_count
+        # Reduce savings due to flood damage
+        self.savings[flooded] *= 0.4
+        self.flags[recovered] &= np.uint8(~FLAG_FLOOD & 0xFF)
+
+    def update_income(self, masks: Optional[Dict[int, np.ndarray]] = None):
+        """Update income and savings based on sector, location, and infrastructure access."""
+        if masks is None:
+            masks = self.flag_masks()
+        params = self.model.params
+        base_income = self.wage_lut[self.sector]
+
+        # The income multiplier chain is accumulated in place in the income
+        # buffer, so each factor costs one pass and no temporary array.
+        income = self.income
+        income[:] = base_income
+
+        # Random variation
+        income *= self.model.rng.normal(1.0, params.income_variation, self.size)
+
+        # Education and health bonuses
+        income *= 1 + self.education_level * params.education_factor
+        income *= 0.5 + self.health_index * params.health_factor
+
+        # Infrastructure bonuses
+        road_access, market_access, utility_access = self.infrastructure_access(
+            masks[FLAG_OFFGRID]
+        )
+        income[road_access] *= params.road_multiplier
+        income[market_access] *= params.market_multiplier
+        income[utility_access] *= params.utility_multiplier
+
+        # Apply Bangladesh-specific adjustments
+        landless = masks[FLAG_LANDLESS]
+        income[landless] *= self.landless_factor_lut[self.sector[landless]]
+
+        # Cooperative members have higher income due to better access
+        income[masks[FLAG_COOPERATIVE]] *= 1.15
+
+        urban = self.is_urban()
+        income[urban] *= self.urban_premium_lut[self.sector[urban]]
+
+        # Flood impact: 40% income loss during flood year
+        income[masks[FLAG_FLOOD]] *= 0.6
+
+        # Add monthly remittances
+        remittances = self.model.rng.normal(2000, 500, self.size)
+        receives = masks[FLAG_REMITTANCES]
+        income[receives] += np.maximum(0, remittances[receives])
+
+        # Update savings
+        self.savings += income * (1 - params.consumption_rate)
+        np.maximum(self.savings, 0, out=self.savings)
+
+    def income_potential(self, x, y) -> np.ndarray:
+        """Look up the potential income at the given grid coordinates."""
+        return self.model.income_potential_grid[x, y]
+
+    def consider_migration(self):
+        """Let non-agricultural households move to more attractive nearby cells."""
+        grid = self.model.grid
+        offsets = moore_offsets(2)
+        order = self.model.rng.permutation(self.size)
+
+        # Farmers are tied to land, so candidates are only built for the
+        # households that may move, in Mesa neighborhood order
+        movers = np.flatnonzero(self.sector != AGRICULTURE)
+        if movers.size == 0:
+            return
+        candidate_x = self.pos_x[movers, None] + offsets[:, 0]
+        candidate_y = self.pos_y[movers, None] + offsets[:, 1]
+        in_bounds = ((candidate_x >= 0) & (candidate_x < grid.width) &
+                     (candidate_y >= 0) & (candidate_y < grid.height))
+        candidate_potential = self.income_potential(
+            np.clip(candidate_x, 0, grid.width - 1), np.clip(candidate_y, 0, grid.height - 1)
+        )
+        current_potential = self.income_potential(self.pos_x[movers], self.pos_y[movers])
+        threshold = current_potential * self.migration_threshold[movers]
+        attractive = in_bounds & (candidate_potential > threshold[:, None])
+
+        # Row of each mover in the candidate arrays
+        row = np.full(self.size, -1, dtype=np.int64)
+        row[movers] = np.arange(len(movers))
+        considering = np.zeros(self.size, dtype=bool)
+        considering[movers] = attractive.any(axis=1)
+
+        # Moves change cell occupancy, so they are resolved one household at a
+        # time against the model's occupancy grid, updated on every move
+        occupancy = self.model.occupancy
+        for index in order[considering[order]]:
+            agent = self.agents[index]
+            r = row[index]
+            for x, y in zip(candidate_x[r][attractive[r]], candidate_y[r][attractive[r]]):
+                # Check if location is available
+                if occupancy[x, y] < 5:  # Max density
+                    if self.model.rng.random() < (1 - self.rural_attachment[index]):
+                        occupancy[self.pos_x[index], self.pos_y[index]] -= 1
+                        occupancy[x, y] += 1
+                        grid.move_agent(agent, (int(x), int(y)))
+                        break
+
+    def make_education_investment(self, masks: Optional[Dict[int, np.ndarray]] = None):
+        """Apply education investments for all households."""
+        if masks is None:
+            masks = self.flag_masks()
+        params = self.model.params
+        education_cost = params.education_cost_multiplier * (self.education_level + 1.0)
+
+        # Higher probability for cooperative members (access to education programs)
+        cooperative = masks[FLAG_COOPERATIVE]
+        invest_p = np.where(cooperative, params.education_investment_probability * 1.3,
+                            params.education_investment_probability)
+        education_cost *= np.where(cooperative, 0.8, 1.0)  # Subsidized through cooperative
+
+        # Lower probability during flood years
+        invest_p *= np.where(masks[FLAG_FLOOD], 0.5, 1.0)
+
+        invests = ((self.savings > 1000) & (self.education_level < 12) &
+                   (self.savings > education_cost) &
+                   (self.model.rng.random(self.size) < invest_p))
+        self.savings[invests] -= education_cost[invests]
+        self.education_level[invests] += 1
+
+    def make_health_investment(self, masks: Optional[Dict[int, np.ndarray]] = None):
+        """Apply health investments for all households."""
+        if masks is None:
+            masks = self.flag_masks()
+        params = self.model.params
+        # Microfinance access increases health investment (health loans)
+        microfinance = masks[FLAG_MICROFINANCE]
+        invest_p = np.where(microfinance, params.health_investment_probability * 1.4,
+                            params.health_investment_probability)
+        # Subsidized through MFI programs
+        health_cost = np.where(microfinance, params.health_investment_cost * 0.9,
+                               float(params.health_investment_cost))
+
+        # Flood affected households prioritize health
+        invest_p *= np.where(masks[FLAG_FLOOD], 1.2, 1.0)
+
+        invests = ((self.health_index < 0.8) & (self.savings > 500) &
+                   (self.model.rng.random(self.size) < invest_p))
+        self.savings[invests] -= health_cost[invests]
+        improvement = params.health_improvement_per_investment
+        self.health_index[invests] = np.minimum(1.0, self.health_index[invests] + improvement)
+
+    def consider_sector_change(self, masks: Optional[Dict[int, np.ndarray]] = None):
+        """Apply sector transitions for all households."""
+        if masks is None:
+            masks = self.flag_masks()
+        draws = self.model.rng.random(self.size)
+
+        # Agriculture to manufacturing/services
+        # Landless agricultural workers more likely to switch
+        switch_p = np.where(masks[FLAG_LANDLESS], 0.1 * 2.0, 0.1)
+        switch_p *= np.where(masks[FLAG_COOPERATIVE], 1.3, 1.0)  # Access to sector transition programs
+        switch_p *= np.where(masks[FLAG_FLOOD], 1.5, 1.0)  # Flood pushes people out of agriculture
+        leaves_agriculture = ((self.education_level >= 8) & (self.sector == AGRICULTURE) &
+                              (draws < switch_p))
+
+        # Manufacturing to services, easier in urban locations
+        switch_p = np.where(self.is_urban(), 0.1, 0.05)
+        enters_services = ((self.education_level >= 10) & (self.sector == MANUFACTURING) &
+                           (draws < switch_p))
+
+        new_sectors = self.model.rng.integers(MANUFACTURING, SERVICES + 1, self.size)
+        self.sector[leaves_agriculture] = new_sectors[leaves_agriculture]
+        self.sector[enters_services] = SERVICES
+
+
+class BusinessPopulation:
+    """
+    Structure-of-arrays store for all businesses in the model.
+
+    The business type uses the household sector codes and the size class
+    indexes BUSINESS_SIZES. Each step updates productivity, revenue,
+    hiring and expansion for every business in one pass.
+    """
+
+    def __init__(self, model, size: int):
+        self.model = model
+        self.size = size
+        self.agents: List = []
+
+        # Business characteristics
+        self.business_type = np.zeros(size, dtype=np.int8)
+        self.size_class = np.zeros(size, dtype=np.int8)
+        self.productivity = np.zeros(size, dtype=np.float32)
+        self.capital = np.zeros(size, dtype=np.float32)
+
+        # Employment
+        self.max_employees = np.zeros(size, dtype=np.int32)
+        self.current_employees = np.zeros(size, dtype=np.int32)
+
+        # Financial
+        self.revenue = np.zeros(size, dtype=np.float32)
+        self.profit = np.zeros(size, dtype=np.float32)
+        self.current_productivity = np.zeros(size, dtype=np.float32)
+
+        # Location
+        self.pos_x = np.full(size, -1, dtype=np.int16)
+        self.pos_y = np.full(size, -1, dtype=np.int16)
+
+    def initialize(self):
+        """Draw the initial characteristics of every business in bulk."""
+        rng = self.model.rng
+        size = self.size
+
+        # Business type distribution
+        self.business_type[:] = rng.choice(len(SECTORS), size, p=[0.5, 0.3, 0.2])
+
+        # Business characteristics
+        self.size_class[:] = rng.choice(len(BUSINESS_SIZES), size, p=[0.7, 0.25, 0.05])
+        self.productivity[:] = rng.uniform(0.5, 1.5, size)
+        capital_mean, capital_std = np.array(CAPITAL_DISTRIBUTION, dtype=float)[self.size_class].T
+        self.capital[:] = rng.normal(capital_mean, capital_std)
+
+        # Employment
+        self.max_employees[:] = MAX_EMPLOYEES[self.size_class]
+        self.current_employees[:] = 0
+
+        # Financial
+        self.revenue[:] = 0
+        self.profit[:] = 0
+
+    def register(self, agent) -> int:
+        """Register a business view and return its index into the arrays."""
+        index = len(self.agents)
+        if index >= self.size:
+            raise ValueError(f"Business population is full ({self.size} businesses)")
+        self.agents.append(agent)
+        return index
+
+    def step(self):
+        """Execute one step of business operations for all businesses."""
+        # Road and utility access share one window; utility access feeds both
+        # productivity and operating costs
+        road_access, utility_access = self.model.infrastructure_index.has_access(
+            ('road', 'utility'), self.pos_x, self.pos_y, 2
+        )
+        self.update_productivity(road_access, utility_access)
+        self.calculate_revenue(utility_access)
+        self.hire_employees()
+        self.consider_expansion()
+
+    def update_productivity(self, road_access: Optional[np.ndarray] = None,
+                            utility_access: Optional[np.ndarray] = None):
+        """Update productivity based on infrastructure access."""
+        index = self.model.infrastructure_index
+        if road_access is None:
+            road_access = index.has_access('road', self.pos_x, self.pos_y, 2)
+        if utility_access is None:
+            utility_access = index.has_access('utility', self.pos_x, self.pos_y, 2)
+        productivity = self.productivity.copy()
+
+        # Infrastructure bonuses
+        productivity[road_access] *= 1.3
+        productivity[utility_access] *= 1.2
+        productivity[index.has_access('market', self.pos_x, self.pos_y, 3)] *= 1.1
+
+        self.current_productivity[:] = productivity
+
+    def calculate_revenue(self, utility_access: Optional[np.ndarray] = None):
+        """Calculate business revenue based on productivity and employees."""
+        if utility_access is None:
+            utility_access = self.model.infrastructure_index.has_access(
+                'utility', self.pos_x, self.pos_y, 2
+            )
+        employee_factor = 1 + self.current_employees * 0.1
+        self.revenue[:] = BASE_REVENUE[self.business_type] * self.current_productivity * employee_factor
+
+        # Operating costs
+        operating_costs = self.current_employees * 2000  # Employee wages
+        infrastructure_costs = np.where(utility_access, 500, 200)
+
+        self.profit[:] = self.revenue - operating_costs - infrastructure_costs
+
+    def hire_employees(self):
+        """Hire one worker where profitable and a same-sector household is nearby."""
+        # Same-sector households within the hiring radius of each business
+        available_workers = self.model.household_index.count(
+            self.pos_x, self.pos_y, 5, sector=self.business_type
+        )
+
+        hires = ((self.profit > 5000) & (self.current_employees < self.max_employees) &
+                 (available_workers > 0) & (self.model.rng.random(self.size) < 0.3))
+        self.current_employees[hires] += 1
+
+    def consider_expansion(self):
+        """Grow profitable small and medium businesses to the next size class."""
+        draws = self.model.rng.random(self.size)
+        small = self.size_class == BUSINESS_SIZE_CODES['small']
+        medium = self.size_class == BUSINESS_SIZE_CODES['medium']
+
+        to_medium = small & (self.profit > 20000) & (draws < 0.1)
+        to_large = medium & (self.profit > 50000) & (draws < 0.05)
+
+        self.size_class[to_medium] = BUSINESS_SIZE_CODES['medium']
+        self.capital[to_medium] *= 2
+        self.size_class[to_large] = BUSINESS_SIZE_CODES['large']
+        self.capital[to_large] *= 3
+        self.max_employees[:] = MAX_EMPLOYEES[self.size_class]
+
+
+class InfrastructurePopulation:
+    """
+    Growable structure-of-arrays store for infrastructure.
+
+    Infrastructure is added over the run by the policy engine, so each
+    registration appends one element to every column. Columns are separate
+    arrays backed by buffers whose capacity doubles when full, and the
+    public attributes are views of the first ``size`` elements. Each step
+    ages all infrastructure, degrades its quality and records service
+    coverage.
+    """
+
+    _COLUMNS = (
+        ('infrastructure_type', np.int8, 0),
+        ('coverage_radius', np.int8, 0),
+        ('capacity', np.float32, 0.0),
+        ('construction_cost', np.float32, 0.0),
+        ('maintenance_cost', np.float32, 0.0),
+        ('quality', np.float32, 1.0),
+        ('age', np.int32, 0),
+        ('pos_x', np.int16, -1),
+        ('pos_y', np.int16, -1),
+    )
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, model):
+        self.model = model
+        self.size = 0
+        self.agents: List = []
+        # Incremented whenever positions or productivity bonuses change, so
+        # derived spatial fields are only rebuilt when they are stale
+        self.version = 0
+        self._buffers = {name: np.zeros(self._INITIAL_CAPACITY, dtype=dtype)
+                         for name, dtype, _ in self._COLUMNS}
+        self._bind_views()
+
+    def _bind_views(self):
+        """Point each public column at the filled part of its buffer."""
+        for name, _, _ in self._COLUMNS:
+            setattr(self, name, self._buffers[name][:self.size])
+
+    def register(self, agent) -> int:
+        """Register an infrastructure view, growing the arrays by one element."""
+        index = self.size
+        for name, _, default in self._COLUMNS:
+            buffer = self._buffers[name]
+            if index == len(buffer):
+                buffer = np.resize(buffer, 2 * len(buffer))
+                self._buffers[name] = buffer
+            buffer[index] = default
+        self.agents.append(agent)
+        self.size += 1
+        self._bind_views()
+        self.version += 1
+        return index
+
+    def type_counts(self) -> np.ndarray:
+        """Return the number of infrastructure elements of each type, indexed by type code."""
+        return np.bincount(self.infrastructure_type, minlength=len(INFRASTRUCTURE_TYPES))
+
+    def productivity_bonus(self) -> np.ndarray:
+        """Return the productivity bonus provided by each infrastructure element."""
+        return INFRASTRUCTURE_BONUS[self.infrastructure_type] * self.quality
+
+    def step(self):
+        """Execute one step of infrastructure operations for all infrastructure."""
+        self.age += 1
+        self.degrade_quality()
+        self.provide_services()
+
+    def degrade_quality(self):
+        """Infrastructure quality degrades over time."""
+        degradation_rate = 0.02  # 2% per year
+        if np.any(self.quality > 0.1):
+            np.maximum(self.quality - degradation_rate, 0.1, out=self.quality)
+            self.version += 1
+
+    def provide_services(self):
+        """Record the households served by infrastructure of each type."""
+        if self.size == 0:
+            return
+
+        # Each type reports the coverage of one of its elements: the last one
+        # in a random order, as when infrastructure stepped individually
+        order = self.model.rng.permutation(self.size)[::-1]
+        types, first = np.unique(self.infrastructure_type[order], return_index=True)
+        reporting = order[first]
+
+        served_households = self.model.household_index.count(
+            self.pos_x[reporting], self.pos_y[reporting], self.coverage_radius[reporting]
+        )
+        coverage = self.model.infrastructure_coverage
+        self.model.total_coverage += int(served_households.sum() - coverage[types].sum())
+        coverage[types] = served_households
@@ -6,15 +6,166 @@ collecting data for analysis and research purposes.
 """
 
 import argparse
+import importlib.util
+import multiprocessing
 import os
-import pandas as pd
-import numpy as np
 from pathlib import Path
-import yaml
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import time
 
-from .model import TownDevelopmentModel
+# pandas, yaml and the model (which pulls in Mesa) are imported where they
+# are used, so the command line starts without paying for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from .model import TownDevelopmentModel
+
+# Model metrics summarized over the final step of each run
+SUMMARY_COLUMNS = (
+    'Population', 'GDP_Per_Capita', 'Gini_Coefficient', 'Average_Education', 'Average_Health',
+    'Urbanization_Rate', 'Service_Access_Rate', 'Agricultural_Employment',
+    'Manufacturing_Employment', 'Services_Employment', 'Road_Coverage', 'School_Coverage',
+    'Clinic_Coverage', 'Market_Coverage', 'Utility_Coverage',
+)
+# Model metrics compared between the first and final steps
+PROGRESS_COLUMNS = ('GDP_Per_Capita', 'Average_Education', 'Average_Health', 'Urbanization_Rate')
+
+# Supported output file formats; Parquet requires pyarrow (or fastparquet)
+OUTPUT_FORMATS = ('csv', 'parquet')
+PARQUET_ENGINES = ('pyarrow', 'fastparquet')
+
+# How much of each batch run is kept: only the first and last model rows
+# the summary report needs, all model rows, or model rows and agent data
+OUTPUT_LEVELS = ('summary', 'model', 'full')
+
+# Environment variables sizing the native thread pools of NumPy's BLAS
+_THREAD_LIMIT_VARIABLES = ('OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'OMP_NUM_THREADS')
+
+
+def output_format_error(output_format: str) -> Optional[str]:
+    """Return why results cannot be saved in an output format, or None if they can."""
+    if output_format == 'parquet' and not any(importlib.util.find_spec(engine)
+                                              for engine in PARQUET_ENGINES):
+        return "--format parquet requires pyarrow or fastparquet (pip install pyarrow)"
+    return None
+
+
+def _check_output_format(output_format: str):
+    """Fail before any simulation runs if its results could not be saved."""
+    error = output_format_error(output_format)
+    if error is not None:
+        raise ImportError(error)
+
+
+def _write_frame(frame: 'pd.DataFrame', output_dir: str, name: str, output_format: str) -> str:
+    """Write a DataFrame to ``<output_dir>/<name>.<output_format>`` and return the path."""
+    path = os.path.join(output_dir, f"{name}.{output_format}")
+    if output_format == 'parquet':
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+    return path
+
+
+def _run_replica(task: Tuple, verbose: bool = False) -> Tuple['pd.DataFrame', Optional['pd.DataFrame'], int]:
+    """
+    Run one simulation of a batch and return its model and agent data.
+    
+    Defined at module level so batch runs can be dispatched to worker
+    processes. Below the 'full' output level no agent data is returned,
+    and at the 'summary' level only the first and last model rows are,
+    together with the number of model rows collected.
+    """
+    model_class, run_id, run_config, max_steps, output_level = task
+    
+    # Create and run model
+    model = model_class(**run_config)
+    
+    # Run simulation
+    start_time = time.time()
+    model.run_steps(max_steps, on_progress=(
+        (lambda step: print(f"  Step {step}/{max_steps}")) if verbose else None
+    ))
+    
+    run_time = time.time() - start_time
+    if verbose:
+        print(f"  Completed in {run_time:.2f} seconds")
+    
+    # Collect data
+    model_data = model.get_model_data()
+    num_rows = len(model_data)
+    if output_level == 'summary':
+        model_data = model_data.iloc[[0, -1]]
+    # Step and AgentID are moved from the index into columns, since frames
+    # are saved without their index
+    agent_data = model.get_agent_data().reset_index() if output_level == 'full' else None
+    
+    # Add run identifier
+    model_data = model_data.assign(run_id=run_id)
+    if agent_data is not None:
+        agent_data['run_id'] = run_id
+    
+    return model_data, agent_data, num_rows
+
+
+def _run_overrides(run_id: int, parameter_sweep: Optional[Dict], seed: Optional[int]) -> Dict:
+    """Return the configuration values of one batch run that differ from the base."""
+    overrides = {}
+    
+    # Apply parameter sweep if specified
+    if parameter_sweep:
+        for param, values in parameter_sweep.items():
+            if isinstance(values, list):
+                overrides[param] = values[run_id % len(values)]
+            else:
+                overrides[param] = values
+                
+    # Set random seed
+    if seed is not None:
+        overrides['random_seed'] = seed + run_id
+        
+    return overrides
+
+
+def _spawn_pool(context, processes: int):
+    """
+    Start a pool of spawned workers with single-threaded BLAS.
+    
+    Workers import NumPy afresh, so their BLAS/OpenMP thread pools are
+    capped at one thread each rather than one per core per worker. The
+    limits are set only while the workers start; the parent's environment
+    is restored afterwards.
+    """
+    saved = {variable: os.environ.get(variable) for variable in _THREAD_LIMIT_VARIABLES}
+    for variable in _THREAD_LIMIT_VARIABLES:
+        os.environ.setdefault(variable, "1")
+    try:
+        return context.Pool(processes)
+    finally:
+        for variable, value in saved.items():
+            if value is None:
+                del os.environ[variable]
+            else:
+                os.environ[variable] = value
+
+
+def _iter_replicas(tasks: List[Tuple], processes: int):
+    """
+    Yield the model and agent data of each batch run, in run order.
+    
+    With more than one process, runs execute on a pool of worker processes
+    and are yielded as they complete in order, so finished runs can be
+    saved while later ones are still running.
+    """
+    if processes > 1:
+        context = multiprocessing.get_context('spawn')
+        with _spawn_pool(context, processes) as pool:
+            # Replicas are long-running, so hand them out one at a time
+            # to keep workers evenly loaded
+            yield from pool.imap(_run_replica, tasks, chunksize=1)
+    else:
+        for task in tasks:
+            print(f"Running simulation {task[1] + 1}/{len(tasks)}...")
+            yield _run_replica(task, verbose=True)
 
 
 class BatchRunner:
@@ -25,7 +176,9 @@ class BatchRunner:
     and generating datasets for research.
     """
     
-    def __init__(self, model_class=TownDevelopmentModel):
+    def __init__(self, model_class=None):
+        if model_class is None:
+            from .model import TownDevelopmentModel as model_class
         self.model_class = model_class
         self.results = []
         
@@ -35,7 +188,10 @@ class BatchRunner:
                   max_steps: int = 100,
                   output_dir: str = "outputs",
                   seed: Optional[int] = None,
-                  parameter_sweep: Optional[Dict] = None):
+                  parameter_sweep: Optional[Dict] = None,
+                  processes: int = 1,
+                  output_format: str = 'csv',
+                  output_level: str = 'full'):
         """
         Run multiple simulations and collect results.
         
@@ -46,7 +202,21 @@ class BatchRunner:
             output_dir: Directory to save outputs
             seed: Random seed for reproducibility
             parameter_sweep: Dictionary of parameters to vary
+            processes: Number of worker processes to run simulations on
+            output_format: Output file format, 'csv' or 'parquet'
+            output_level: 'full' saves model metrics and agent data, 'model'
+                only model metrics, and 'summary' only the summary report
+            
+        Returns:
+            Tuple of the model metrics of all runs (first and last step
+            only at the 'summary' level) and the path of the saved agent
+            data, or None below the 'full' level. Agent data is written to
+            disk as runs finish rather than returned in memory.
         """
+        _check_output_format(output_format)
+        
+        import pandas as pd
+        import yaml
         
         # Create output directory
         Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -58,80 +228,81 @@ class BatchRunner:
         print(f"Starting batch run: {num_runs} simulations, {max_steps} steps each")
         print(f"Output directory: {output_dir}")
         
-        all_model_data = []
-        all_agent_data = []
-        
-        for run_id in range(num_runs):
-            print(f"Running simulation {run_id + 1}/{num_runs}...")
-            
-            # Set up configuration for this run
-            run_config = base_config.copy()
-            
-            # Apply parameter sweep if specified
-            if parameter_sweep:
-                for param, values in parameter_sweep.items():
-                    if isinstance(values, list):
-                        run_config[param] = values[run_id % len(values)]
-                    else:
-                        run_config[param] = values
-            
-            # Set random seed
-            if seed is not None:
-                np.random.seed(seed + run_id)
-                run_config['random_seed'] = seed + run_id
-            
-            # Create and run model
-            model = self.model_class(**run_config)
-            
-            # Run simulation
-            start_time = time.time()
-            for step in range(max_steps):
-                model.step()
-                
-                # Progress indicator
-                if (step + 1) % 20 == 0:
-                    print(f"  Step {step + 1}/{max_steps}")
-            
-            run_time = time.time() - start_time
-            print(f"  Completed in {run_time:.2f} seconds")
+        # Settings shared by every run; agent data is never collected when
+        # it is not saved
+        if output_level != 'full':
+            base_config = dict(base_config, collect_agent_data=False)
             
-            # Collect data
-            model_data = model.get_model_data()
-            agent_data = model.get_agent_data()
+        # Each run's configuration is the base plus its own overrides
+        tasks = [
+            (self.model_class, run_id,
+             dict(base_config, **_run_overrides(run_id, parameter_sweep, seed)),
+             max_steps, output_level)
+            for run_id in range(num_runs)
+        ]
             
-            # Add run identifier
-            model_data['run_id'] = run_id
-            agent_data['run_id'] = run_id
+        # Runs are independent, so they can be spread across processes
+        processes = min(processes, num_runs)
+        if processes > 1:
+            print(f"Running {num_runs} simulations on {processes} processes...")
             
+        # Agent data is the bulk of the output, so CSV rows are written as
+        # each run finishes rather than held for the whole batch
+        save_agents = output_level == 'full'
+        stream_agents = save_agents and output_format == 'csv'
+        agent_output_path = os.path.join(output_dir, f"agent_data.{output_format}")
+        all_model_data = []
+        all_agent_data = []
+        total_steps = 0
+        for model_data, agent_data, num_rows in _iter_replicas(tasks, processes):
             all_model_data.append(model_data)
-            all_agent_data.append(agent_data)
+            total_steps += num_rows
+            if not save_agents:
+                continue
+            if stream_agents:
+                first = len(all_model_data) == 1
+                agent_data.to_csv(agent_output_path, mode='w' if first else 'a', header=first,
+                                  index=False)
+            else:
+                all_agent_data.append(agent_data)
             
         # Combine all runs
         print("Combining results...")
         combined_model_data = pd.concat(all_model_data, ignore_index=True)
-        combined_agent_data = pd.concat(all_agent_data, ignore_index=True)
         
         # Save results
-        model_output_path = os.path.join(output_dir, "model_metrics.csv")
-        agent_output_path = os.path.join(output_dir, "agent_data.csv")
-        
-        combined_model_data.to_csv(model_output_path, index=False)
-        combined_agent_data.to_csv(agent_output_path, index=False)
-        
-        print(f"Results saved:")
-        print(f"  Model metrics: {model_output_path}")
-        print(f"  Agent data: {agent_output_path}")
+        if output_level != 'summary':
+            model_output_path = _write_frame(combined_model_data, output_dir, "model_metrics",
+                                             output_format)
+            print(f"Results saved:")
+            print(f"  Model metrics: {model_output_path}")
+        if save_agents:
+            if not stream_agents:
+                _write_frame(pd.concat(all_agent_data, ignore_index=True), output_dir,
+                             "agent_data", output_format)
+            print(f"  Agent data: {agent_output_path}")
         
         # Generate summary statistics
-        self.generate_summary_report(combined_model_data, output_dir)
+        self.generate_summary_report(combined_model_data, output_dir, total_steps)
         
-        return combined_model_data, combined_agent_data
+        return combined_model_data, (agent_output_path if save_agents else None)
         
-    def generate_summary_report(self, model_data: pd.DataFrame, output_dir: str):
-        """Generate a summary report of simulation results."""
+    def generate_summary_report(self, model_data: 'pd.DataFrame', output_dir: str,
+                                total_steps: Optional[int] = None):
+        """
+        Generate a summary report of simulation results.
+        
+        Only the first and last row of each run are read, except for
+        ``total_steps``, which defaults to the number of model rows.
+        """
         
         summary_path = os.path.join(output_dir, "summary_report.txt")
         
+        # First and last step of each run, taken in a single grouping
+        endpoints = model_data.groupby('run_id')[list(SUMMARY_COLUMNS)].agg(['first', 'last'])
+        initial_data = endpoints.xs('first', axis=1, level=1)
+        final_data = endpoints.xs('last', axis=1, level=1)
+        
         with open(summary_path, 'w') as f:
             f.write("=== Village to Town Simulation Summary Report ===\n\n")
             
@@ -139,49 +310,53 @@ class BatchRunner:
             f.write("SIMULATION OVERVIEW\n")
             f.write(f"Number of runs: {model_data['run_id'].nunique()}\n")
             f.write(f"Steps per run: {model_data['Step'].max()}\n")
-            f.write(f"Total simulation steps: {len(model_data)}\n\n")
+            if total_steps is None:
+                total_steps = len(model_data)
+            f.write(f"Total simulation steps: {total_steps}\n\n")
             
-            # Final outcomes (last step of each run)
-            final_data = model_data.groupby('run_id').last()
+            # Final outcomes (last step of each run), with the mean and
+            # standard deviation of every column taken in one aggregation
+            final = final_data.agg(['mean', 'std'])
+            mean, std = final.loc['mean'], final.loc['std']
             
             f.write("FINAL OUTCOMES (Average across runs)\n")
-            f.write(f"Population: {final_data['Population'].mean():.1f} ± {final_data['Population'].std():.1f}\n")
-            f.write(f"GDP per capita: {final_data['GDP_Per_Capita'].mean():.0f} ± {final_data['GDP_Per_Capita'].std():.0f} Taka\n")
-            f.write(f"Gini coefficient: {final_data['Gini_Coefficient'].mean():.3f} ± {final_data['Gini_Coefficient'].std():.3f}\n")
-            f.write(f"Average education: {final_data['Average_Education'].mean():.1f} ± {final_data['Average_Education'].std():.1f} years\n")
-            f.write(f"Average health: {final_data['Average_Health'].mean():.3f} ± {final_data['Average_Health'].std():.3f}\n")
-            f.write(f"Urbanization rate: {final_data['Urbanization_Rate'].mean():.1%} ± {final_data['Urbanization_Rate'].std():.1%}\n")
-            f.write(f"Service access: {final_data['Service_Access_Rate'].mean():.1%} ± {final_data['Service_Access_Rate'].std():.1%}\n\n")
+            f.write(f"Population: {mean['Population']:.1f} ± {std['Population']:.1f}\n")
+            f.write(f"GDP per capita: {mean['GDP_Per_Capita']:.0f} ± {std['GDP_Per_Capita']:.0f} Taka\n")
+            f.write(f"Gini coefficient: {mean['Gini_Coefficient']:.3f} ± {std['Gini_Coefficient']:.3f}\n")
+            f.write(f"Average education: {mean['Average_Education']:.1f} ± {std['Average_Education']:.1f} years\n")
+            f.write(f"Average health: {mean['Average_Health']:.3f} ± {std['Average_Health']:.3f}\n")
+            f.write(f"Urbanization rate: {mean['Urbanization_Rate']:.1%} ± {std['Urbanization_Rate']:.1%}\n")
+            f.write(f"Service access: {mean['Service_Access_Rate']:.1%} ± {std['Service_Access_Rate']:.1%}\n\n")
             
             # Sector distribution
             f.write("EMPLOYMENT DISTRIBUTION (Final)\n")
-            f.write(f"Agriculture: {final_data['Agricultural_Employment'].mean():.1f} people\n")
-            f.write(f"Manufacturing: {final_data['Manufacturing_Employment'].mean():.1f} people\n")
-            f.write(f"Services: {final_data['Services_Employment'].mean():.1f} people\n\n")
+            f.write(f"Agriculture: {mean['Agricultural_Employment']:.1f} people\n")
+            f.write(f"Manufacturing: {mean['Manufacturing_Employment']:.1f} people\n")
+            f.write(f"Services: {mean['Services_Employment']:.1f} people\n\n")
             
             # Infrastructure
             f.write("INFRASTRUCTURE (Final)\n")
-            f.write(f"Roads: {final_data['Road_Coverage'].mean():.1f}\n")
-            f.write(f"Schools: {final_data['School_Coverage'].mean():.1f}\n")
-            f.write(f"Clinics: {final_data['Clinic_Coverage'].mean():.1f}\n")
-            f.write(f"Markets: {final_data['Market_Coverage'].mean():.1f}\n")
-            f.write(f"Utilities: {final_data['Utility_Coverage'].mean():.1f}\n\n")
+            f.write(f"Roads: {mean['Road_Coverage']:.1f}\n")
+            f.write(f"Schools: {mean['School_Coverage']:.1f}\n")
+            f.write(f"Clinics: {mean['Clinic_Coverage']:.1f}\n")
+            f.write(f"Markets: {mean['Market_Coverage']:.1f}\n")
+            f.write(f"Utilities: {mean['Utility_Coverage']:.1f}\n\n")
             
             # Development progress
             f.write("DEVELOPMENT PROGRESS\n")
-            initial_data = model_data.groupby('run_id').first()
+            initial_mean = initial_data[list(PROGRESS_COLUMNS)].mean()
             
-            gdp_growth = ((final_data['GDP_Per_Capita'].mean() - initial_data['GDP_Per_Capita'].mean()) / 
-                         initial_data['GDP_Per_Capita'].mean()) * 100
+            gdp_growth = ((mean['GDP_Per_Capita'] - initial_mean['GDP_Per_Capita']) / 
+                         initial_mean['GDP_Per_Capita']) * 100
             f.write(f"GDP per capita growth: {gdp_growth:.1f}%\n")
             
-            education_improvement = final_data['Average_Education'].mean() - initial_data['Average_Education'].mean()
+            education_improvement = mean['Average_Education'] - initial_mean['Average_Education']
             f.write(f"Education improvement: +{education_improvement:.1f} years\n")
             
-            health_improvement = final_data['Average_Health'].mean() - initial_data['Average_Health'].mean()
+            health_improvement = mean['Average_Health'] - initial_mean['Average_Health']
             f.write(f"Health improvement: +{health_improvement:.3f}\n")
             
-            urbanization_change = final_data['Urbanization_Rate'].mean() - initial_data['Urbanization_Rate'].mean()
+            urbanization_change = mean['Urbanization_Rate'] - initial_mean['Urbanization_Rate']
             f.write(f"Urbanization increase: +{urbanization_change:.1%}\n")
             
         print(f"Summary report saved: {summary_path}")
@@ -191,7 +366,8 @@ def run_single_simulation(config_path: str,
                          steps: int = 100,
                          output_dir: str = "outputs",
                          seed: Optional[int] = None,
-                         verbose: bool = True) -> TownDevelopmentModel:
+                         verbose: bool = True,
+                         output_format: str = 'csv') -> 'TownDevelopmentModel':
     """
     Run a single simulation and save results.
     
@@ -201,10 +377,15 @@ def run_single_simulation(config_path: str,
         output_dir: Output directory
         seed: Random seed
         verbose: Print progress information
+        output_format: Output file format, 'csv' or 'parquet'
         
     Returns:
         Completed model instance
     """
+    _check_output_format(output_format)
+    
+    import yaml
+    from .model import TownDevelopmentModel
     
     # Create output directory
     Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -220,22 +401,23 @@ def run_single_simulation(config_path: str,
     
     # Set random seed
     if seed is not None:
-        np.random.seed(seed)
         config['random_seed'] = seed
     
     if verbose:
         print(f"Starting simulation: {steps} steps")
         print(f"Output directory: {output_dir}")
     
-    # Create and run model
+    # Create and run model; CSV agent data is streamed to disk as it is
+    # collected
     model = TownDevelopmentModel(**config)
+    if output_format == 'csv':
+        agent_output_path = os.path.join(output_dir, "agent_data.csv")
+        model.stream_agent_data(agent_output_path)
     
     start_time = time.time()
-    for step in range(steps):
-        model.step()
-        
-        if verbose and (step + 1) % 20 == 0:
-            print(f"Step {step + 1}/{steps}")
+    model.run_steps(steps, on_progress=(
+        (lambda step: print(f"Step {step}/{steps}")) if verbose else None
+    ))
     
     run_time = time.time() - start_time
     
@@ -244,13 +426,10 @@ def run_single_simulation(config_path: str,
     
     # Save results
     model_data = model.get_model_data()
-    agent_data = model.get_agent_data()
-    
-    model_output_path = os.path.join(output_dir, "model_metrics.csv")
-    agent_output_path = os.path.join(output_dir, "agent_data.csv")
-    
-    model_data.to_csv(model_output_path, index=False)
-    agent_data.to_csv(agent_output_path, index=False)
+    model_output_path = _write_frame(model_data, output_dir, "model_metrics", output_format)
+    if output_format != 'csv':
+        agent_output_path = _write_frame(model.get_agent_data().reset_index(), output_dir,
+                                         "agent_data", output_format)
     
     if verbose:
         print(f"Results saved:")
@@ -269,6 +448,56 @@ def run_single_simulation(config_path: str,
     return model
 
 
+def run(config: str = "vtown/config/default.yaml",
+        steps: int = 100,
+        output: str = "outputs",
+        seed: Optional[int] = None,
+        runs: int = 1,
+        batch: bool = False,
+        processes: Optional[int] = None,
+        verbose: bool = True,
+        output_format: str = 'csv',
+        output_level: str = 'full'):
+    """
+    Run a single simulation or a batch of simulations.
+    
+    Args:
+        config: Path to YAML configuration file
+        steps: Number of simulation steps to run
+        output: Output directory for results
+        seed: Random seed for reproducible results
+        runs: Number of simulation runs
+        batch: Run in batch mode even for a single run
+        processes: Worker processes for batch mode (default: one per CPU core)
+        verbose: Print progress for single runs
+        output_format: Output file format, 'csv' or 'parquet'
+        output_level: Outputs kept in batch mode, 'summary', 'model' or 'full'
+    """
+    if batch or runs > 1:
+        # Batch mode
+        runner = BatchRunner()
+        runner.run_batch(
+            config_path=config,
+            num_runs=runs,
+            max_steps=steps,
+            output_dir=output,
+            seed=seed,
+            processes=processes or os.cpu_count() or 1,
+            output_format=output_format,
+            output_level=output_level
+        )
+    else:
+        # Single simulation
+        run_single_simulation(
+            config_path=config,
+            steps=steps,
+            output_dir=output,
+            seed=seed,
+            verbose=verbose,
+            output_format=output_format
+        )
+
+
 def main():
     """Command line interface for headless simulation."""
     
@@ -317,6 +546,27 @@ def main():
         help="Run in batch mode with multiple simulations"
     )
     
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Worker processes for batch mode (default: one per CPU core)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output file format (parquet requires pyarrow)"
+    )
+    
+    parser.add_argument(
+        "--output-level",
+        choices=OUTPUT_LEVELS,
+        default="full",
+        help="Batch outputs to save: summary report only, plus model metrics, or plus agent data"
+    )
+    
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -325,25 +575,22 @@ def main():
     
     args = parser.parse_args()
     
-    if args.batch or args.runs > 1:
-        # Batch mode
-        runner = BatchRunner()
-        runner.run_batch(
-            config_path=args.config,
-            num_runs=args.runs,
-            max_steps=args.steps,
-            output_dir=args.output,
-            seed=args.seed
-        )
-    else:
-        # Single simulation
-        run_single_simulation(
-            config_path=args.config,
-            steps=args.steps,
-            output_dir=args.output,
-            seed=args.seed,
-            verbose=not args.quiet
-        )
+    error = output_format_error(args.format)
+    if error is not None:
+        parser.error(error)
+    
+    run(
+        config=args.config,
+        steps=args.steps,
+        output=args.output,
+        seed=args.seed,
+        runs=args.runs,
+        batch=args.batch,
+        processes=args.processes,
+        verbose=not args.quiet,
+        output_format=args.format,
+        output_level=args.output_level
+    )
 
 
 if __name__ == "__main__":
@@ -7,12 +7,99 @@ and interact with model parameters.
 """
 
 import mesa
+import numpy as np
 from mesa.visualization.modules import CanvasGrid, ChartModule
 from mesa.visualization.ModularVisualization import ModularServer
-from mesa.visualization.UserActivatedAgent import UserActivatedAgent
 
 from .model import TownDevelopmentModel
-from .agents import HouseholdAgent, BusinessAgent, InfrastructureAgent
+from .agents import KIND_BUSINESS, KIND_HOUSEHOLD, KIND_INFRASTRUCTURE
+
+
+# Portrayal styles, indexed by sector, business size and infrastructure type
+# codes so each agent is drawn with tuple lookups
+HOUSEHOLD_COLORS = (
+    "#8FBC8F",  # Agriculture: light green
+    "#4682B4",  # Manufacturing: steel blue
+    "#DAA520",  # Services: golden rod
+)
+BUSINESS_COLORS = (
+    "#228B22",  # Agriculture: forest green
+    "#DC143C",  # Manufacturing: crimson
+    "#FF8C00",  # Services: dark orange
+)
+BUSINESS_WIDTHS = (0.6, 0.8, 1.0)  # Small, medium, large
+# Infrastructure is labelled with one ASCII letter rather than an emoji,
+# which takes several code points (and escaped JSON bytes) per agent per frame
+INFRASTRUCTURE_STYLES = (
+    ("#696969", "R"),  # Road: dim gray
+    ("#FFD700", "S"),  # School: gold
+    ("#FF6347", "C"),  # Clinic: tomato
+    ("#9370DB", "M"),  # Market: medium purple
+    ("#20B2AA", "U"),  # Utility: light sea green
+)
+
+
+def _portray_household(agent):
+    """Circle colored by sector and sized by income level."""
+    # Size based on income level
+    income = agent.income
+    if income > 6000:
+        radius = 0.8
+    elif income < 3000:
+        radius = 0.4
+    else:
+        radius = 0.6
+        
+    return {
+        "Shape": "circle",
+        "Filled": "true",
+        "Layer": 1,
+        "r": radius,
+        "Color": HOUSEHOLD_COLORS[agent.sector_code],
+        # Text showing household size
+        "text": str(agent.household_size),
+        "text_color": "white",
+    }
+
+
+def _portray_business(agent):
+    """Square colored by business type and sized by business size."""
+    width = BUSINESS_WIDTHS[agent.size_code]
+    return {
+        "Shape": "rect",
+        "Filled": "true",
+        "Layer": 2,
+        "w": width,
+        "h": width,
+        "Color": BUSINESS_COLORS[agent.business_type_code],
+        # Text showing employee count
+        "text": str(agent.current_employees),
+        "text_color": "white",
+    }
+
+
+def _portray_infrastructure(agent):
+    """Full-cell square with a type letter, faded by quality."""
+    color, label = INFRASTRUCTURE_STYLES[agent.infrastructure_type_code]
+    return {
+        "Shape": "rect",
+        "Filled": "true",
+        "Layer": 0,
+        "w": 1.0,
+        "h": 1.0,
+        "Color": color,
+        "text": label,
+        # Opacity based on quality
+        "opacity": float(max(0.3, agent.quality)),
+        "text_color": "white",
+    }
+
+
+_PORTRAYALS = {
+    KIND_HOUSEHOLD: _portray_household,
+    KIND_BUSINESS: _portray_business,
+    KIND_INFRASTRUCTURE: _portray_infrastructure,
+}
 
 
 def agent_portrayal(agent):
@@ -21,209 +108,129 @@ def agent_portrayal(agent):
     
     Returns a dictionary with visualization properties for each agent type.
     """
-    if isinstance(agent, HouseholdAgent):
-        portrayal = {
-            "Shape": "circle",
-            "Filled": "true",
-            "Layer": 1,
-            "r": 0.6,
-        }
-        
-        # Color based on sector
-        if agent.sector == "agriculture":
-            portrayal["Color"] = "#8FBC8F"  # Light green
-        elif agent.sector == "manufacturing":
-            portrayal["Color"] = "#4682B4"  # Steel blue
-        else:  # services
-            portrayal["Color"] = "#DAA520"  # Golden rod
-            
-        # Size based on income level
-        if agent.income > 6000:
-            portrayal["r"] = 0.8
-        elif agent.income < 3000:
-            portrayal["r"] = 0.4
-            
-        # Add text showing household size
-        portrayal["text"] = str(agent.household_size)
-        portrayal["text_color"] = "white"
-        
-    elif isinstance(agent, BusinessAgent):
-        portrayal = {
-            "Shape": "rect",
-            "Filled": "true",
-            "Layer": 2,
-            "w": 0.8,
-            "h": 0.8,
-        }
-        
-        # Color based on business type
-        if agent.business_type == "agriculture":
-            portrayal["Color"] = "#228B22"  # Forest green
-        elif agent.business_type == "manufacturing":
-            portrayal["Color"] = "#DC143C"  # Crimson
-        else:  # services
-            portrayal["Color"] = "#FF8C00"  # Dark orange
-            
-        # Size based on business size
-        if agent.size == "large":
-            portrayal["w"] = 1.0
-            portrayal["h"] = 1.0
-        elif agent.size == "small":
-            portrayal["w"] = 0.6
-            portrayal["h"] = 0.6
-            
-        # Add text showing employee count
-        portrayal["text"] = str(agent.current_employees)
-        portrayal["text_color"] = "white"
-        
-    elif isinstance(agent, InfrastructureAgent):
-        portrayal = {
-            "Shape": "rect",
-            "Filled": "true",
-            "Layer": 0,
-            "w": 1.0,
-            "h": 1.0,
-        }
-        
-        # Color and symbol based on infrastructure type
-        if agent.infrastructure_type == "road":
-            portrayal["Color"] = "#696969"  # Dim gray
-            portrayal["text"] = "🛤️"
-        elif agent.infrastructure_type == "school":
-            portrayal["Color"] = "#FFD700"  # Gold
-            portrayal["text"] = "🏫"
-        elif agent.infrastructure_type == "clinic":
-            portrayal["Color"] = "#FF6347"  # Tomato
-            portrayal["text"] = "🏥"
-        elif agent.infrastructure_type == "market":
-            portrayal["Color"] = "#9370DB"  # Medium purple
-            portrayal["text"] = "🏪"
-        elif agent.infrastructure_type == "utility":
-            portrayal["Color"] = "#20B2AA"  # Light sea green
-            portrayal["text"] = "⚡"
-            
-        # Opacity based on quality
-        portrayal["opacity"] = max(0.3, agent.quality)
-        
-        portrayal["text_color"] = "white"
-        
-    return portrayal
+    return _PORTRAYALS[agent.kind](agent)
 
 
 def get_happy_agents(model):
     """Count agents with above-average income (happiness proxy)."""
-    households = [agent for agent in model.schedule.agents 
-                 if isinstance(agent, HouseholdAgent)]
+    incomes = model.households.income
     
-    if not households:
+    if not incomes.size:
         return 0
         
-    avg_income = sum(h.income for h in households) / len(households)
-    return sum(1 for h in households if h.income > avg_income)
-
-
-# Define the grid visualization
-grid = CanvasGrid(
-    agent_portrayal, 
-    50,  # Grid width
-    50,  # Grid height  
-    500, # Canvas width in pixels
-    500  # Canvas height in pixels
-)
-
-# Define charts for tracking key metrics
-gdp_chart = ChartModule([
-    {"Label": "GDP_Per_Capita", "Color": "#3498db"},
-], data_collector_name='datacollector')
-
-population_chart = ChartModule([
-    {"Label": "Population", "Color": "#e74c3c"},
-    {"Label": "Total_Businesses", "Color": "#f39c12"},
-], data_collector_name='datacollector')
-
-development_chart = ChartModule([
-    {"Label": "Average_Education", "Color": "#9b59b6"},
-    {"Label": "Average_Health", "Color": "#1abc9c"},
-    {"Label": "Urbanization_Rate", "Color": "#34495e"},
-], data_collector_name='datacollector')
-
-sector_chart = ChartModule([
-    {"Label": "Agricultural_Employment", "Color": "#27ae60"},
-    {"Label": "Manufacturing_Employment", "Color": "#2980b9"},
-    {"Label": "Services_Employment", "Color": "#f1c40f"},
-], data_collector_name='datacollector')
-
-infrastructure_chart = ChartModule([
-    {"Label": "Road_Coverage", "Color": "#95a5a6"},
-    {"Label": "School_Coverage", "Color": "#f39c12"},
-    {"Label": "Clinic_Coverage", "Color": "#e74c3c"},
-    {"Label": "Market_Coverage", "Color": "#9b59b6"},
-    {"Label": "Utility_Coverage", "Color": "#1abc9c"},
-], data_collector_name='datacollector')
-
-inequality_chart = ChartModule([
-    {"Label": "Gini_Coefficient", "Color": "#e67e22"},
-    {"Label": "Service_Access_Rate", "Color": "#16a085"},
-], data_collector_name='datacollector')
-
-
-# Model parameters that can be adjusted in the web interface
-model_params = {
-    "initial_population": mesa.visualization.Slider(
-        "Initial Population",
-        200,   # Default value
-        50,    # Minimum
-        500,   # Maximum
-        25     # Step size
-    ),
-    "initial_businesses": mesa.visualization.Slider(
-        "Initial Businesses",
-        30,    # Default value
-        10,    # Minimum
-        100,   # Maximum
-        5      # Step size
-    ),
-    "policy_budget": mesa.visualization.Slider(
-        "Annual Policy Budget (Taka)",
-        100000,  # Default value
-        50000,   # Minimum
-        500000,  # Maximum
-        25000    # Step size
-    ),
-    "grid_width": mesa.visualization.Slider(
-        "Grid Width",
-        50,    # Default value
-        30,    # Minimum
-        100,   # Maximum
-        10     # Step size
-    ),
-    "grid_height": mesa.visualization.Slider(
-        "Grid Height", 
-        50,    # Default value
-        30,    # Minimum
-        100,   # Maximum
-        10     # Step size
-    ),
-}
+    avg_income = incomes.mean(dtype=np.float64)
+    return int(np.count_nonzero(incomes > avg_income))
 
-# Create the modular server
-server = ModularServer(
-    TownDevelopmentModel,
-    [
-        grid,
-        gdp_chart,
-        population_chart,
-        development_chart,
-        sector_chart,
-        infrastructure_chart,
-        inequality_chart
-    ],
-    "Village to Town Development Simulation",
-    model_params
-)
 
-# Set the port
-server.port = 8521
+def make_server(port: int = 8521):
+    """
+    Build the visualization server.
+    
+    The grid, charts and parameter sliders are constructed here rather than
+    at import time, so importing this module stays cheap.
+    """
+    # Define the grid visualization
+    grid = CanvasGrid(
+        agent_portrayal, 
+        50,  # Grid width
+        50,  # Grid height  
+        500, # Canvas width in pixels
+        500  # Canvas height in pixels
+    )
+
+    # Define charts for tracking key metrics
+    gdp_chart = ChartModule([
+        {"Label": "GDP_Per_Capita", "Color": "#3498db"},
+    ], data_collector_name='datacollector')
+
+    population_chart = ChartModule([
+        {"Label": "Population", "Color": "#e74c3c"},
+        {"Label": "Total_Businesses", "Color": "#f39c12"},
+    ], data_collector_name='datacollector')
+
+    development_chart = ChartModule([
+        {"Label": "Average_Education", "Color": "#9b59b6"},
+        {"Label": "Average_Health", "Color": "#1abc9c"},
+        {"Label": "Urbanization_Rate", "Color": "#34495e"},
+    ], data_collector_name='datacollector')
+
+    sector_chart = ChartModule([
+        {"Label": "Agricultural_Employment", "Color": "#27ae60"},
+        {"Label": "Manufacturing_Employment", "Color": "#2980b9"},
+        {"Label": "Services_Employment", "Color": "#f1c40f"},
+    ], data_collector_name='datacollector')
+
+    infrastructure_chart = ChartModule([
+        {"Label": "Road_Coverage", "Color": "#95a5a6"},
+        {"Label": "School_Coverage", "Color": "#f39c12"},
+        {"Label": "Clinic_Coverage", "Color": "#e74c3c"},
+        {"Label": "Market_Coverage", "Color": "#9b59b6"},
+        {"Label": "Utility_Coverage", "Color": "#1abc9c"},
+    ], data_collector_name='datacollector')
+
+    inequality_chart = ChartModule([
+        {"Label": "Gini_Coefficient", "Color": "#e67e22"},
+        {"Label": "Service_Access_Rate", "Color": "#16a085"},
+    ], data_collector_name='datacollector')
+
+    # Model parameters that can be adjusted in the web interface
+    model_params = {
+        "initial_population": mesa.visualization.Slider(
+            "Initial Population",
+            200,   # Default value
+            50,    # Minimum
+            500,   # Maximum
+            25     # Step size
+        ),
+        "initial_businesses": mesa.visualization.Slider(
+            "Initial Businesses",
+            30,    # Default value
+            10,    # Minimum
+            100,   # Maximum
+            5      # Step size
+        ),
+        "policy_budget": mesa.visualization.Slider(
+            "Annual Policy Budget (Taka)",
+            100000,  # Default value
+            50000,   # Minimum
+            500000,  # Maximum
+            25000    # Step size
+        ),
+        "grid_width": mesa.visualization.Slider(
+            "Grid Width",
+            50,    # Default value
+            30,    # Minimum
+            100,   # Maximum
+            10     # Step size
+        ),
+        "grid_height": mesa.visualization.Slider(
+            "Grid Height", 
+            50,    # Default value
+            30,    # Minimum
+            100,   # Maximum
+            10     # Step size
+        ),
+    }
+
+    # Create the modular server
+    server = ModularServer(
+        TownDevelopmentModel,
+        [
+            grid,
+            gdp_chart,
+            population_chart,
+            development_chart,
+            sector_chart,
+            infrastructure_chart,
+            inequality_chart
+        ],
+        "Village to Town Development Simulation",
+        model_params
+    )
+
+    # Set the port
+    server.port = port
+    return server
 
 
 def launch_server():
@@ -233,7 +240,7 @@ def launch_server():
     print("\nVisualization Guide:")
     print("- Circles: Households (green=agriculture, blue=manufacturing, gold=services)")
     print("- Squares: Businesses (green=agriculture, red=manufacturing, orange=services)")
-    print("- Infrastructure: Roads🛤️, Schools🏫, Clinics🏥, Markets🏪, Utilities⚡")
+    print("- Infrastructure: Roads (R), Schools (S), Clinics (C), Markets (M), Utilities (U)")
     print("- Size indicates economic level, opacity shows infrastructure quality")
     print("\nControls:")
     print("- Adjust parameters in the left panel")
@@ -241,7 +248,7 @@ def launch_server():
     print("- Click 'Step' for single step or 'Start' for continuous simulation")
     print("\nPress Ctrl+C to stop the server")
     
-    server.launch()
+    make_server().launch()
 
 
 if __name__ == "__main__":
@@ -8,9 +8,27 @@ visualization, and common calculations used throughout the simulation.
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from typing import Dict, List, Tuple, Optional, Any
+import multiprocessing
 import os
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .stats import gini
+
+# Urbanization phases, in order of the recent growth rates that separate them
+PHASE_TYPES = ('stagnation', 'steady_growth', 'rapid_growth')
+PHASE_GROWTH_THRESHOLDS = (0.005, 0.01)
+
+# Agent data columns read by load_and_analyze_results
+AGENT_ANALYSIS_COLUMNS = ['Step', 'Agent_Type', 'Income']
+AGENT_DATA_CHUNK_SIZE = 1_000_000
+
+# Resolution of saved plots
+PLOT_DPI = 150
+AGG_PATH_CHUNKSIZE = 10000
+_STYLE_APPLIED = False
 
 
 def calculate_gini_coefficient(incomes: List[float]) -> float:
@@ -23,20 +41,25 @@ def calculate_gini_coefficient(incomes: List[float]) -> float:
     Returns:
         Gini coefficient (0 = perfect equality, 1 = perfect inequality)
     """
-    if not incomes or len(incomes) < 2:
-        return 0.0
-        
-    # Remove any negative or zero incomes
-    incomes = [i for i in incomes if i > 0]
-    
-    if len(incomes) < 2:
-        return 0.0
-        
-    incomes = sorted(incomes)
-    n = len(incomes)
-    cumsum = np.cumsum(incomes)
+    return gini(np.asarray(incomes, dtype=np.float64))
+
+
+def _nearest_neighbor_distances(positions: np.ndarray, block_size: int = 1024) -> np.ndarray:
+    """
+    Distance from each of two or more (x, y) positions to its nearest other position.
     
-    return (n + 1 - 2 * sum((n + 1 - i) * income for i, income in enumerate(incomes, 1))) / (n * sum(incomes))
+    Pairwise distances are computed for blocks of rows at a time, so memory
+    stays proportional to ``block_size`` times the number of positions.
+    """
+    n = len(positions)
+    nearest = np.empty(n)
+    for start in range(0, n, block_size):
+        block = positions[start:start + block_size]
+        squared = ((block[:, None, :] - positions[None, :, :]) ** 2).sum(axis=-1)
+        rows = np.arange(len(block))
+        squared[rows, start + rows] = np.inf  # Exclude each position itself
+        nearest[start:start + len(block)] = squared.min(axis=1)
+    return np.sqrt(nearest)
 
 
 def calculate_spatial_statistics(agents, grid_width: int, grid_height: int) -> Dict[str, float]:
@@ -59,9 +82,11 @@ def calculate_spatial_statistics(agents, grid_width: int, grid_height: int) -> D
             'clustering_index': 0
         }
     
-    positions = [agent.pos for agent in agents if hasattr(agent, 'pos')]
+    # Positions as one (n, 2) array rather than a list of tuples
+    positions = np.fromiter((coord for agent in agents if hasattr(agent, 'pos') for coord in agent.pos),
+                            dtype=np.float64).reshape(-1, 2)
     
-    if not positions:
+    if not len(positions):
         return {
             'center_of_mass_x': grid_width / 2,
             'center_of_mass_y': grid_height / 2,
@@ -70,25 +95,18 @@ def calculate_spatial_statistics(agents, grid_width: int, grid_height: int) -> D
         }
     
     # Center of mass
-    center_x = sum(pos[0] for pos in positions) / len(positions)
-    center_y = sum(pos[1] for pos in positions) / len(positions)
+    center = positions.mean(axis=0)
+    center_x, center_y = float(center[0]), float(center[1])
     
     # Spatial dispersion (average distance from center of mass)
-    distances = [np.sqrt((pos[0] - center_x)**2 + (pos[1] - center_y)**2) for pos in positions]
-    spatial_dispersion = sum(distances) / len(distances)
+    spatial_dispersion = np.linalg.norm(positions - center, axis=1).mean()
     
     # Clustering index (average distance to nearest neighbor)
-    nearest_neighbor_distances = []
-    for i, pos1 in enumerate(positions):
-        min_distance = float('inf')
-        for j, pos2 in enumerate(positions):
-            if i != j:
-                distance = np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                min_distance = min(min_distance, distance)
-        if min_distance != float('inf'):
-            nearest_neighbor_distances.append(min_distance)
-    
-    clustering_index = sum(nearest_neighbor_distances) / len(nearest_neighbor_distances) if nearest_neighbor_distances else 0
+    if len(positions) > 1:
+        nearest_neighbor_distances = _nearest_neighbor_distances(positions)
+        clustering_index = nearest_neighbor_distances.mean()
+    else:
+        clustering_index = 0
     
     return {
         'center_of_mass_x': center_x,
@@ -113,9 +131,13 @@ def analyze_development_trajectory(model_data: pd.DataFrame) -> Dict[str, Any]:
     
     analysis = {}
     
+    # Metric columns used below, extracted once as arrays
+    gdp_per_capita, urbanization, gini_values = (
+        model_data[col].to_numpy() for col in ('GDP_Per_Capita', 'Urbanization_Rate', 'Gini_Coefficient'))
+    
     # Growth rates
-    initial_gdp = model_data['GDP_Per_Capita'].iloc[0]
-    final_gdp = model_data['GDP_Per_Capita'].iloc[-1]
+    initial_gdp = gdp_per_capita[0]
+    final_gdp = gdp_per_capita[-1]
     steps = len(model_data)
     
     if initial_gdp > 0:
@@ -123,7 +145,6 @@ def analyze_development_trajectory(model_data: pd.DataFrame) -> Dict[str, Any]:
         analysis['gdp_growth_rate_per_step'] = gdp_growth_rate
     
     # Development phases
-    urbanization = model_data['Urbanization_Rate'].values
     analysis['urbanization_phases'] = identify_development_phases(urbanization)
     
     # Infrastructure development pattern
@@ -134,12 +155,11 @@ def analyze_development_trajectory(model_data: pd.DataFrame) -> Dict[str, Any]:
     analysis['infrastructure_development'] = analyze_infrastructure_pattern(infrastructure_data)
     
     # Inequality trajectory
-    gini_values = model_data['Gini_Coefficient'].values
     analysis['inequality_trend'] = analyze_inequality_trend(gini_values)
     
     # Sector transition
     sector_cols = ['Agricultural_Employment', 'Manufacturing_Employment', 'Services_Employment']
-    if all(col in model_data.columns for col in sector_cols):
+    if frozenset(model_data.columns).issuperset(sector_cols):
         sector_data = model_data[sector_cols]
         analysis['sector_transition'] = analyze_sector_transition(sector_data)
     
@@ -156,25 +176,18 @@ def identify_development_phases(urbanization: np.ndarray) -> List[Dict[str, Any]
     # Calculate growth rates
     growth_rates = np.diff(urbanization)
     
-    # Identify phases based on growth rate changes
-    current_phase = {'start': 0, 'type': 'initial'}
+    # Mean growth over the five steps before each step from 6 on (the
+    # minimum phase length), classified as stagnation, steady growth
+    # (above 0.005) or rapid growth (above 0.01)
+    recent_growth = sliding_window_view(growth_rates[:-1], 5)[1:].mean(axis=1)
+    labels = np.digitize(recent_growth, PHASE_GROWTH_THRESHOLDS, right=True)
     
-    for i in range(1, len(growth_rates)):
-        if i > 5:  # Minimum phase length
-            recent_growth = np.mean(growth_rates[max(0, i-5):i])
-            
-            if recent_growth > 0.01:  # High growth
-                if current_phase['type'] != 'rapid_growth':
-                    phases.append(current_phase)
-                    current_phase = {'start': i, 'type': 'rapid_growth'}
-            elif recent_growth > 0.005:  # Moderate growth
-                if current_phase['type'] != 'steady_growth':
-                    phases.append(current_phase)
-                    current_phase = {'start': i, 'type': 'steady_growth'}
-            else:  # Slow/no growth
-                if current_phase['type'] != 'stagnation':
-                    phases.append(current_phase)
-                    current_phase = {'start': i, 'type': 'stagnation'}
+    # A new phase starts at step 6 and wherever the classification changes
+    changes = np.flatnonzero(np.diff(labels)) + 1
+    current_phase = {'start': 0, 'type': 'initial'}
+    for index in np.concatenate(([0], changes)):
+        phases.append(current_phase)
+        current_phase = {'start': int(index) + 6, 'type': PHASE_TYPES[labels[index]]}
     
     # Add final phase
     current_phase['end'] = len(urbanization) - 1
@@ -186,26 +199,27 @@ def identify_development_phases(urbanization: np.ndarray) -> List[Dict[str, Any]
 def analyze_infrastructure_pattern(infrastructure_data: pd.DataFrame) -> Dict[str, Any]:
     """Analyze infrastructure development patterns."""
     analysis = {}
+    values = infrastructure_data.to_numpy()
     
     # Total infrastructure development
-    total_infrastructure = infrastructure_data.sum(axis=1)
-    analysis['total_growth'] = total_infrastructure.iloc[-1] - total_infrastructure.iloc[0]
-    
-    # Infrastructure type priorities (which was built first/most)
-    final_values = infrastructure_data.iloc[-1]
-    analysis['infrastructure_ranking'] = final_values.sort_values(ascending=False).to_dict()
-    
-    # Development timing (when each type started growing)
-    development_timing = {}
-    for col in infrastructure_data.columns:
-        values = infrastructure_data[col].values
-        first_growth = np.where(np.diff(values) > 0)[0]
-        if len(first_growth) > 0:
-            development_timing[col] = first_growth[0]
-        else:
-            development_timing[col] = len(values)
+    analysis['total_growth'] = values[-1].sum() - values[0].sum()
+    
+    # Infrastructure type priorities (which was built first/most); the
+    # stable sort keeps column order among ties
+    final_values = values[-1]
+    order = np.argsort(-final_values, kind='stable')
+    analysis['infrastructure_ranking'] = dict(zip(infrastructure_data.columns[order],
+                                                  final_values[order].tolist()))
+    
+    # Development timing (when each type started growing), found for all
+    # types at once; types that never grew get the series length
+    grew = np.diff(values, axis=0) > 0
+    if len(grew):
+        first_growth = np.where(grew.any(axis=0), grew.argmax(axis=0), len(values))
+    else:
+        first_growth = np.full(values.shape[1], len(values))
     
-    analysis['development_timing'] = development_timing
+    analysis['development_timing'] = dict(zip(infrastructure_data.columns, first_growth.tolist()))
     
     return analysis
 
@@ -246,34 +260,29 @@ def analyze_sector_transition(sector_data: pd.DataFrame) -> Dict[str, Any]:
     """Analyze sector transition patterns."""
     analysis = {}
     
-    # Calculate sector shares over time
-    total_employment = sector_data.sum(axis=1)
-    sector_shares = sector_data.div(total_employment, axis=0)
+    # Sector shares at the first and last step only
+    employment = sector_data.to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        initial = employment[0] / employment[0].sum()
+        final = employment[-1] / employment[-1].sum()
     
     # Initial and final composition
-    initial_shares = sector_shares.iloc[0].to_dict()
-    final_shares = sector_shares.iloc[-1].to_dict()
-    
-    analysis['initial_composition'] = initial_shares
-    analysis['final_composition'] = final_shares
+    sectors = list(sector_data.columns)
+    analysis['initial_composition'] = dict(zip(sectors, initial.tolist()))
+    analysis['final_composition'] = dict(zip(sectors, final.tolist()))
     
     # Transition pattern
-    changes = {}
-    for sector in sector_shares.columns:
-        changes[sector] = final_shares[sector] - initial_shares[sector]
-    
-    analysis['sector_changes'] = changes
+    changes = final - initial
+    analysis['sector_changes'] = dict(zip(sectors, changes.tolist()))
     
     # Identify dominant transition
-    max_increase = max(changes.values())
-    max_decrease = min(changes.values())
+    increase = changes.argmax()
+    decrease = changes.argmin()
     
-    if abs(max_decrease) > max_increase:
-        declining_sector = [k for k, v in changes.items() if v == max_decrease][0]
-        analysis['primary_transition'] = f"decline_of_{declining_sector}"
+    if abs(changes[decrease]) > changes[increase]:
+        analysis['primary_transition'] = f"decline_of_{sectors[decrease]}"
     else:
-        growing_sector = [k for k, v in changes.items() if v == max_increase][0]
-        analysis['primary_transition'] = f"growth_of_{growing_sector}"
+        analysis['primary_transition'] = f"growth_of_{sectors[increase]}"
     
     return analysis
 
@@ -282,17 +291,27 @@ def create_development_plots(model_data: pd.DataFrame, output_dir: str = "plots"
     """
     Create visualization plots for development analysis.
     
+    Figures are built with Matplotlib's object-oriented API and rendered
+    straight to PNG, without going through pyplot's GUI backend.
+    
     Args:
         model_data: DataFrame with simulation results
         output_dir: Directory to save plots
     """
+    global _STYLE_APPLIED
+    
     os.makedirs(output_dir, exist_ok=True)
     
-    # Set style
-    plt.style.use('seaborn-v0_8')
+    # Set style once per process; long time series are rendered in chunks
+    # of points rather than as one path
+    if not _STYLE_APPLIED:
+        plt.style.use('seaborn-v0_8')
+        plt.rcParams['agg.path.chunksize'] = AGG_PATH_CHUNKSIZE
+        _STYLE_APPLIED = True
     
     # 1. Economic development over time
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    fig = Figure(figsize=(15, 12))
+    axes = fig.subplots(2, 2)
     
     # GDP per capita
     axes[0, 0].plot(model_data['Step'], model_data['GDP_Per_Capita'])
@@ -320,58 +339,78 @@ def create_development_plots(model_data: pd.DataFrame, output_dir: str = "plots"
     axes[1, 1].set_ylabel('Level')
     axes[1, 1].legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'economic_development.png'), dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'economic_development.png'), dpi=PLOT_DPI)
     
     # 2. Sector composition over time
-    plt.figure(figsize=(12, 8))
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
     
     sector_cols = ['Agricultural_Employment', 'Manufacturing_Employment', 'Services_Employment']
-    if all(col in model_data.columns for col in sector_cols):
-        total_employment = model_data[sector_cols].sum(axis=1)
+    if frozenset(model_data.columns).issuperset(sector_cols):
+        # Employment shares of each sector, normalized in one division
+        employment = model_data[sector_cols].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shares = employment / employment.sum(axis=1, keepdims=True)
         
-        plt.stackplot(model_data['Step'],
-                     model_data['Agricultural_Employment'] / total_employment,
-                     model_data['Manufacturing_Employment'] / total_employment,
-                     model_data['Services_Employment'] / total_employment,
+        ax.stackplot(model_data['Step'].to_numpy(), shares.T,
                      labels=['Agriculture', 'Manufacturing', 'Services'],
                      alpha=0.7)
         
-        plt.title('Employment Sector Composition Over Time')
-        plt.xlabel('Step')
-        plt.ylabel('Employment Share')
-        plt.legend(loc='upper right')
-        plt.ylim(0, 1)
+        ax.set_title('Employment Sector Composition Over Time')
+        ax.set_xlabel('Step')
+        ax.set_ylabel('Employment Share')
+        ax.legend(loc='upper right')
+        ax.set_ylim(0, 1)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'sector_composition.png'), dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'sector_composition.png'), dpi=PLOT_DPI)
     
     # 3. Infrastructure development
-    plt.figure(figsize=(12, 8))
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
     
     infrastructure_cols = ['Road_Coverage', 'School_Coverage', 'Clinic_Coverage', 
                           'Market_Coverage', 'Utility_Coverage']
     
     for col in infrastructure_cols:
         if col in model_data.columns:
-            plt.plot(model_data['Step'], model_data[col], 
+            ax.plot(model_data['Step'], model_data[col], 
                     label=col.replace('_Coverage', ''), linewidth=2)
     
-    plt.title('Infrastructure Development Over Time')
-    plt.xlabel('Step')
-    plt.ylabel('Coverage (Number of Infrastructure)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.set_title('Infrastructure Development Over Time')
+    ax.set_xlabel('Step')
+    ax.set_ylabel('Coverage (Number of Infrastructure)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'infrastructure_development.png'), dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'infrastructure_development.png'), dpi=PLOT_DPI)
     
     print(f"Plots saved to {output_dir}/")
 
 
+def _final_household_rows(agent_data_path: str, chunksize: int = AGENT_DATA_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Read the household rows of the final step from an agent data CSV.
+    
+    The file is scanned in chunks twice, first for the final step and then
+    for its household rows, so memory is bounded by the chunk size and one
+    step's agents rather than the whole agent history.
+    """
+    final_step = max(chunk['Step'].max() for chunk in
+                     pd.read_csv(agent_data_path, usecols=['Step'], dtype={'Step': np.int32},
+                                 chunksize=chunksize))
+    
+    # Only the columns used by the analysis are parsed; agent types are
+    # read as categoricals so filtering compares integer codes, not strings
+    chunks = pd.read_csv(agent_data_path, usecols=AGENT_ANALYSIS_COLUMNS,
+                         dtype={'Step': np.int32, 'Agent_Type': 'category', 'Income': np.float64},
+                         chunksize=chunksize)
+    return pd.concat([chunk[(chunk['Step'] == final_step) &
+                            (chunk['Agent_Type'] == 'HouseholdAgent')] for chunk in chunks])
+
+
 def load_and_analyze_results(results_dir: str) -> Dict[str, Any]:
     """
     Load simulation results and perform comprehensive analysis.
@@ -397,21 +436,42 @@ def load_and_analyze_results(results_dir: str) -> Dict[str, Any]:
         
     # Load agent data for additional analysis
     if os.path.exists(agent_data_path):
-        agent_data = pd.read_csv(agent_data_path)
-        
         # Final step agent analysis
-        final_step = agent_data['Step'].max()
-        final_agents = agent_data[agent_data['Step'] == final_step]
+        households = _final_household_rows(agent_data_path)
         
         # Income distribution
-        households = final_agents[final_agents['Agent_Type'] == 'HouseholdAgent']
         if not households.empty:
-            incomes = households['Income'].dropna().values
+            incomes = households['Income'].dropna().to_numpy()
             analysis['final_income_distribution'] = {
                 'mean': np.mean(incomes),
                 'median': np.median(incomes),
                 'std': np.std(incomes),
-                'gini': calculate_gini_coefficient(incomes.tolist())
+                'gini': gini(incomes)
             }
     
     return analysis
+
+
+def analyze_many(results_dirs: List[str], processes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Load and analyze several result directories, e.g. the runs of a sweep.
+    
+    Directories are independent, so with more than one process they are
+    analyzed on a pool of worker processes (one per CPU core by default).
+    Workers are spawned rather than forked, since Matplotlib state is not
+    safe to share.
+    
+    Args:
+        results_dirs: Directories containing CSV result files
+        processes: Number of worker processes
+        
+    Returns:
+        Analysis results, in the order of ``results_dirs``
+    """
+    processes = min(processes or os.cpu_count() or 1, len(results_dirs))
+    if processes <= 1:
+        return [load_and_analyze_results(results_dir) for results_dir in results_dirs]
+        
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes) as pool:
+        return pool.map(load_and_analyze_results, results_dirs, chunksize=1)